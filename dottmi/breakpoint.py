@@ -181,7 +181,10 @@ class HaltPoint(Breakpoint):
         try:
             self._q.get(block=True, timeout=timeout)
         except queue.Empty:
+            # an exception raised in reached() is more informative than the resulting timeout
+            ExceptionPropagator.check()
             raise TimeoutError(f'Timeout ({timeout}s) while waiting to reach halt point at {self._location}.') from None
+        ExceptionPropagator.check()
 
     def reached_internal(self, payload=None) -> None:
         self._hits += 1
@@ -352,6 +355,7 @@ class InterceptPoint(threading.Thread, Breakpoint):
             timeout = 20
         wait_ok = self._event.wait(timeout)
         self._event.clear()
+        ExceptionPropagator.check()
 
         if (not wait_ok) and timeout_override:
             raise TimeoutError(f'Breakpoint {self._location} not reached after override timeout of {timeout}secs.')
@@ -143,12 +143,18 @@ class Dott(object):
         else:
             raise DottException(f'Unknown debug monitor type {dconf.get(DottConf.keys.monitor_type)}.')
 
-        gdb_server: GdbServer = monitor.create_gdb_server(dconf)
-
         # start GDB client
+        # note: the GDB client is started before the GDB server since GDB's startup (which runs in its own process)
+        #       then overlaps with the (potentially lengthy) startup of the GDB server
         gdb_client = GdbClient(dconf.get(DottConf.keys.gdb_client_binary))
         gdb_client.create()
 
+        try:
+            gdb_server: GdbServer = monitor.create_gdb_server(dconf)
+        except Exception:
+            gdb_client.gdb_mi.write_non_blocking('-gdb-exit')
+            raise
+
         try:
             # create target instance and set GDB server address
             target = target.Target(gdb_server, gdb_client, monitor, dconf)
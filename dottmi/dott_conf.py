@@ -27,7 +27,7 @@ import sys
 from ctypes import CDLL
 from importlib.machinery import SourceFileLoader
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 from dottmi.dottexceptions import DottException
 from dottmi.target_mem import TargetMemModel
@@ -45,6 +45,7 @@ class DottConfExt(object):
     key/value pairs from dott.ini always have lower priority than key/value pairs programmatically set prior to
     calling parse_config().
     """
+    __slots__ = ('_conf', '_dott_runtime', '_dott_runtime_path', '_parsed', '_dott_ini', 'conf')
 
     def __init__(self, ini_file='dott.ini') -> None:
         """
@@ -54,7 +55,7 @@ class DottConfExt(object):
             ini_file: Alternative name for DOTT ini file. Ini file is expected to be located in current work directory
             (or relative to it).
         """
-        self._conf = {}
+        self._conf: Dict[str, str | int | None] = {}
         self._dott_runtime = None
         self._dott_runtime_path: str | None = None
         self._parsed = None
@@ -71,6 +72,15 @@ class DottConfExt(object):
         """
         self._conf[key] = val
 
+    def update(self, key_vals: Dict[str, str | None]) -> None:
+        """
+        Set multiple key / value pairs in the configuration object in one go.
+
+        Args:
+            key_vals: Dictionary with key / value pairs to be set. Keys should be keys from DottConf.keys.
+        """
+        self._conf.update(key_vals)
+
     def get(self, key: str) -> str | int | None:
         """
         Returns the value for the given key.
@@ -80,7 +90,7 @@ class DottConfExt(object):
 
         Returns: The value for the given key or None if the key does not exist.
         """
-        return self._conf[key] if key in self._conf.keys() else None
+        return self._conf.get(key)
 
     def set_runtime_if_unset(self, dott_runtime_path: str) -> None:
         """
@@ -546,6 +556,11 @@ class DottConf(object):
         """See get method in :func:`DottConfExt.set`."""
         DottConf.conf.set(key, val)
 
+    @staticmethod
+    def update(key_vals: Dict[str, str | None]) -> None:
+        """See update method in :func:`DottConfExt.update`."""
+        DottConf.conf.update(key_vals)
+
     @staticmethod
     def set_runtime_if_unset(dott_runtime_path: str) -> None:
         """See get method in :func:`DottConfExt.set_runtime_if_unset`."""
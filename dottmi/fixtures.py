@@ -31,11 +31,12 @@ from dottmi.dott import DottConf, dott
 from dottmi.dottexceptions import DottException
 from dottmi.pylinkdott import TargetDirect
 from dottmi.target_mem import TargetMemModel, TargetMemTestHook, TargetMem, TargetMemNoAlloc
-from dottmi.utils import log
+from dottmi.utils import log, ExceptionPropagator
 
 
 # ----------------------------------------------------------------------------------------------------------------------
-def target_load_common(name: str, load_to_flash: bool, silent: bool = False, dt: Target = None) -> None:
+def target_load_common(name: str, load_to_flash: bool, silent: bool = False, dt: Target = None,
+                       skip_if_unchanged: bool = False) -> None:
     dt = dott().target if dt is None else dt
     if dt is None:
         log.error('Connection to target (via JLINK) was not properly established. Please check your JLINK parameters!')
@@ -48,13 +49,13 @@ def target_load_common(name: str, load_to_flash: bool, silent: bool = False, dt:
         # optionally load bootloader binary (load elf ONLY - symbols are loaded after the app)
         bl_load_elf = dt.dconf.get(DottConf.keys.bl_load_elf)
         if bl_load_elf is not None:
-            dt.load(bl_load_elf, None, enable_flash=load_to_flash)
+            dt.load(bl_load_elf, None, enable_flash=load_to_flash, skip_if_unchanged=skip_if_unchanged)
 
         # load application binaries
         app_load_elf = dt.dconf.get(DottConf.keys.app_load_elf)
         app_symbol_elf = dt.dconf.get(DottConf.keys.app_symbol_elf)
         if app_load_elf is not None:
-            dt.load(app_load_elf, app_symbol_elf, enable_flash=load_to_flash)
+            dt.load(app_load_elf, app_symbol_elf, enable_flash=load_to_flash, skip_if_unchanged=skip_if_unchanged)
 
         # add bootloader symbol file; note: it is important to this 'add' so after doing target.load() with symbol elf.
         bl_symbol_elf = dt.dconf.get(DottConf.keys.bl_symbol_elf)
@@ -88,6 +89,19 @@ def target_load_flash(silent: bool = False) -> None:
     target_load_common('FLASH', load_to_flash=True, silent=silent)
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def target_load_flash_if_changed(silent: bool = False) -> None:
+    """
+    Same as target_load_flash but the download is skipped if the target FLASH already holds the binary (e.g., from a
+    previous test session). This is checked via GDB's compare-sections which only considers the ELF file's loadable
+    sections. Note: If the download is skipped, the target's register state (e.g., the PC set to the entry point by
+    the download) is not updated. Hence, this fixture should be combined with a fixture resetting the target (e.g.,
+    target_reset_flash). To use it, assign it in your conftest.py: target_load = target_load_flash_if_changed
+    """
+    target_load_common('FLASH', load_to_flash=True, silent=silent, skip_if_unchanged=True)
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 @pytest.fixture(scope='function')
 def target_load_flash_always(silent: bool = False) -> None:
@@ -302,6 +316,19 @@ def target_reset_flash(request) -> None:
     yield from target_reset_common(request)
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture(scope='class')
+def target_reset_flash_once(request) -> None:
+    """
+    Same as target_reset_flash but with CLASS scope. The target is only reset once for all tests of a test class which
+    use this fixture. This is intended for tests which do not modify the target state (e.g., register reads). Tests
+    which do modify the target state should use the function-scoped target_reset_flash fixture instead.
+    Args:
+        request: PyTest request object.
+    """
+    yield from target_reset_common(request)
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 @pytest.fixture(scope='function')
 def live_access():
@@ -322,6 +349,29 @@ def dott_auto_func_cleanup():
     yield
     dott().target.halt()
     InterceptPoint.delete_all()
+    # raise exceptions (e.g., failed assertions in halt/intercept point callbacks) which were propagated from
+    # threads but were not yet raised in the main thread
+    ExceptionPropagator.check()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Raises exceptions (e.g., failed assertions in halt/intercept point callbacks) which were propagated from threads
+    while the test function was running. This way, they are reported as failure of the test itself (and not as error
+    during teardown). If the test function failed by itself, its failure is kept and propagated exceptions are only
+    logged. Import this hook in your pytest conftest.py file.
+    """
+    try:
+        res = yield
+    except BaseException:
+        try:
+            ExceptionPropagator.check()
+        except Exception as exc:
+            log.error('Exception propagated from thread while test failed:', exc_info=exc)
+        raise
+    ExceptionPropagator.check()
+    return res
 
 
 def pytest_configure(config):
@@ -34,6 +34,9 @@ from dottmi.gdb_mi import GdbMi
 from dottmi.gdbcontrollerdott import GdbControllerDott
 from dottmi.utils import log
 
+# parent folder of the dottmi package (added to GDB's PYTHONPATH); resolved once at import time
+_DOTTMI_PARENT_DIR: str = str(Path(__file__).resolve().parent.parent)
+
 
 class GdbServer(ABC):
     def __init__(self, addr, port):
@@ -344,8 +347,7 @@ class GdbClient(object):
         self._mi_controller: GdbControllerDott | None = None
         self._gdb_mi: GdbMi | None = None
 
-        my_dir = os.path.dirname(os.path.realpath(__file__))
-        os.environ['PYTHONPATH'] = os.pathsep + str(Path(my_dir + '/..'))
+        os.environ['PYTHONPATH'] = os.pathsep + _DOTTMI_PARENT_DIR
 
     # Create DB client instance.
     def create(self) -> None:
@@ -238,6 +238,37 @@ class MIDottThreadState(gdb.MICommand):
         return {'inferiors': inferiors, 'inferior': inferior, 'inferior_threads': inferior_threads, 'thread_running': res}
 
 
+class MIDottBpCount(gdb.MICommand):
+    """
+    MI command to return the number of (user) breakpoints without transferring the entire breakpoint table.
+    """
+    def __init__(self, name):
+        super().__init__(name)
+
+    def invoke(self, argv):
+        return {'count': str(len(gdb.breakpoints()))}
+
+
+class MIDottStepItBlock(gdb.MICommand):
+    """
+    MI command to perform instruction stepping until the target has left an IT block (i.e., until the IT bits in
+    xPSR are cleared). Takes the name of the xPSR register as argument and returns the number of steps performed.
+    """
+    IT_BITS_MASK = (0b11 << 25) | (0b111111 << 10)
+    MAX_STEPS = 16  # an IT block spans up to four instructions; just a safety net
+
+    def __init__(self, name):
+        super().__init__(name)
+
+    def invoke(self, argv):
+        xpsr = '$%s' % (argv[0] if len(argv) > 0 else 'xpsr')
+        steps = 0
+        while steps < self.MAX_STEPS and (int(gdb.parse_and_eval(xpsr)) & self.IT_BITS_MASK) != 0:
+            gdb.execute('stepi', to_string=True)
+            steps += 1
+        return {'steps': str(steps)}
+
+
 # Initialize command(s)
 DottCmdInterceptPointCmds()
 DottCmdInterceptPoint()
@@ -245,3 +276,5 @@ DottCmdInterceptPointDelete()
 DottCmdIsRunning()
 MIDottCmdCliExec('-dott-cli-exec')
 MIDottThreadState('-dott-get-thread-state')
+MIDottStepItBlock('-dott-step-it-block')
+MIDottBpCount('-dott-bp-count')
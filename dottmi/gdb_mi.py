@@ -19,7 +19,8 @@ import os
 import queue
 import threading
 import time
-from typing import Dict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, List
 
 from pygdbmi.gdbcontroller import GdbController
 
@@ -81,6 +82,13 @@ class GdbMi(object):
         """
         return self._mi_context
 
+    def is_alive(self) -> bool:
+        """
+        Returns True if the GDB process controlled via this object is still running, False otherwise.
+        """
+        gdb_process = self._mi_controller.gdb_process
+        return gdb_process is not None and gdb_process.poll() is None
+
     ###############################################################################################
     # Helper functions to get the next CLI and MI tokens
     def _get_next_cli_token(self) -> int:
@@ -142,7 +150,8 @@ class GdbMi(object):
         token = self._get_next_mi_token()
         if self._trace_commands:
             log.debug(f'{token}         gdb write: {cmd}')
-        self.debug_capture.record(f'[TO GDB] {token} {cmd}')
+        if self.debug_capture.enabled:
+            self.debug_capture.record(f'[TO GDB] {token} {cmd}')
 
         try:
             self._mi_controller.write("%d%s" % (token, cmd), read_response=False)
@@ -176,6 +185,37 @@ class GdbMi(object):
                 raise e
         return ret_val
 
+    def write_blocking_batch(self, cmds: List[str], timeout: float = None) -> List[Dict]:
+        """
+        Sends all provided commands to GDB without waiting for the individual results in between and then blocks
+        until GDB has returned the results for all commands. Compared to issuing the commands one by one via
+        write_blocking, the round-trip latency is only paid once for the whole batch.
+        Args:
+            cmds: The commands to be sent to GDB.
+            timeout: The amount of time to block at maximum while waiting for each of the responses. If the timeout
+            is reached, a TimeoutError exception is raised.
+
+        Returns:
+            The results of the commands sent to GDB as a list of dictionaries (in the same order as cmds).
+        """
+        tokens: List[int] = [self.write_non_blocking(cmd) for cmd in cmds]
+
+        ret_val: List[Dict] = []
+        first_ex: Exception | None = None
+        for token in tokens:
+            # Note: All results are collected even if an error was returned for one of the commands. Otherwise,
+            #       the results of the remaining commands would be left behind in the response dictionary.
+            try:
+                ret_val.append(self._mi_wait_token_result(token, timeout))
+            except TimeoutError:
+                raise
+            except Exception as ex:
+                if first_ex is None:
+                    first_ex = ex
+        if first_ex is not None:
+            raise first_ex
+        return ret_val
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 class GdbMiContext(object):
@@ -254,7 +294,8 @@ class GdbMiResponseHandler(threading.Thread):
                     msg_type = str(msg['type']).lower()
                     if self._trace_commands:
                         log.debug('[MSG] %s' % msg)
-                    self._debug_capture.record('  [FROM GDB] %s' % msg)
+                    if self._debug_capture.enabled:
+                        self._debug_capture.record('  [FROM GDB] %s' % msg)
 
                     if msg_type == 'result':
                         msg_token = -1
@@ -341,21 +382,56 @@ class GdbMiResponseHandler(threading.Thread):
 
 # ----------------------------------------------------------------------------------------------------------------------
 class NotifySubscriber:
-    def __init__(self):
+    __slots__ = ('_notifications', '_executor', '_callback_lock', '_pending_callbacks', '_callbacks_done')
+
+    def __init__(self, executor: Executor | None = None):
+        """
+        Args:
+            executor: Executor used to run asynchronous notification callbacks. If None (default), the subscriber
+                      creates its own single-worker thread pool (on first use). Note: Subscribers are not meant to share
+                      an executor with a limited number of workers. A callback which blocks (e.g., waits for the halt of
+                      another target) would otherwise starve the callbacks of all other subscribers.
+        """
         self._notifications: queue.Queue = queue.Queue()
+        self._executor: Executor | None = executor
+        # serializes the callbacks of this subscriber such that notifications are processed in the order of arrival
+        self._callback_lock: threading.Lock = threading.Lock()
+        # number of submitted but not yet completed callbacks; _callbacks_done is notified when it drops to zero
+        self._pending_callbacks: int = 0
+        self._callbacks_done: threading.Condition = threading.Condition()
+
+    def _run_notify_callback(self) -> None:
+        try:
+            with self._callback_lock:
+                self._notify_callback()
+        finally:
+            with self._callbacks_done:
+                self._pending_callbacks -= 1
+                if self._pending_callbacks == 0:
+                    self._callbacks_done.notify_all()
+
+    @staticmethod
+    def _log_callback_exception(future: Future) -> None:
+        ex = future.exception()
+        if ex is not None:
+            log.error(f'Notification callback failed: {ex}', exc_info=ex)
 
     def notify(self, msg: Dict, asycn_callback: bool = False) -> None:
         """
         Put given message into queue. Optionally execute a callback function implemented by a subclass of
-        NotifySubscriber in an own thread.
+        NotifySubscriber in a worker thread of the subscriber's executor.
         Args:
             msg: Message to be put into queue.
-            asycn_callback: Run callback in an own thread
+            asycn_callback: Run callback in a worker thread
         """
         self._notifications.put(msg)
         if asycn_callback:
-            # Run notification callback in own thread
-            threading.Thread(target=self._notify_callback).start()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='NotifyCallback')
+            with self._callbacks_done:
+                self._pending_callbacks += 1
+            # Run notification callback in worker thread
+            self._executor.submit(self._run_notify_callback).add_done_callback(NotifySubscriber._log_callback_exception)
 
     def _notify_callback(self):
         """
@@ -379,6 +455,14 @@ class NotifySubscriber:
         """
         return self._notifications.get(block, timeout)
 
+    def wait_callbacks_processed(self) -> None:
+        """
+        Blocks until all pending notifications have been processed by the asynchronous notification callback (i.e.,
+        until all callbacks submitted so far have completed). Must not be called from within a notification callback.
+        """
+        with self._callbacks_done:
+            self._callbacks_done.wait_for(lambda: self._pending_callbacks == 0)
+
     def all_notificaitons_processed(self) -> bool:
         """
         Return True if all pending notifications have been processed, False otherwise.
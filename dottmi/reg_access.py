@@ -16,6 +16,7 @@
 ###############################################################################
 
 from abc import ABC, abstractmethod
+from typing import Tuple
 
 from dottmi.dott import dott
 from dottmi.target import Target
@@ -28,7 +29,7 @@ class RegBits:
     def __init__(self, start: int, end: int):
         self.start = start
         self.end = end
-        self.mask = (pow(2, end - start + 1) - 1)
+        self.mask = (1 << (end - start + 1)) - 1
 
 
 class DeviceRegsDott(ABC):
@@ -43,6 +44,32 @@ class DeviceRegsDott(ABC):
     def target(self) -> Target:
         return self._dt
 
+    def fetch_many(self, *regs: 'RegBase', max_gap: int = 0) -> None:
+        """
+        Fetches the given registers. Registers whose address ranges are at most max_gap bytes apart are fetched with
+        a single memory read covering all of them instead of one read per register. Note that a max_gap larger than
+        zero also reads the bytes between the registers which might have side effects for some peripherals.
+
+        Args:
+            regs: Registers to be fetched.
+            max_gap: Maximum number of bytes between two registers such that they are still fetched with a single read.
+        """
+        regs = sorted(regs, key=lambda r: r._reg_addr)
+        idx: int = 0
+        while idx < len(regs):
+            lo: int = regs[idx]._reg_addr
+            hi: int = lo + (regs[idx]._reg_size >> 3)
+            end: int = idx + 1
+            while end < len(regs) and regs[end]._reg_addr <= hi + max_gap:
+                hi = max(hi, regs[end]._reg_addr + (regs[end]._reg_size >> 3))
+                end += 1
+
+            data: bytes = self._dt.mem.read(lo, hi - lo)
+            for r in regs[idx:end]:
+                offs: int = r._reg_addr - lo
+                r.raw = int.from_bytes(data[offs:offs + (r._reg_size >> 3)], byteorder=self._dt.byte_order)
+            idx = end
+
 
 class RegBase(ABC):
     """
@@ -62,13 +89,25 @@ class RegBase(ABC):
         self._reg_raw &= ~(rb.mask << rb.start)
         self._reg_raw |= ((val & rb.mask) << rb.start)
 
+    def _reg_field_names(self) -> Tuple[str, ...]:
+        # note: all instances of a register class have the same bit fields; since dir() is expensive, the field names
+        #       are only determined once and are then cached in the (concrete) register class
+        cls = type(self)
+        names: Tuple[str, ...] | None = cls.__dict__.get('_field_names')
+        if names is None:
+            names = tuple(prop[6:] for prop in dir(self) if prop.startswith('_bits_'))
+            cls._field_names = names
+        return names
+
     def _reg_from_raw(self):
-        for p in [prop for prop in dir(self) if prop.startswith('_bits_')]:
-            self.__setattr__(p[6:], self._reg_bits_from_raw(self.__getattribute__(p)))
+        raw: int = self._reg_raw
+        for name in self._reg_field_names():
+            rb: RegBits = getattr(self, '_bits_' + name)
+            setattr(self, name, (raw >> rb.start) & rb.mask)
 
     def _reg_to_raw(self):
-        for p in [prop for prop in dir(self) if prop.startswith('_bits_')]:
-            self._reg_bits_to_raw(self.__getattribute__(p[6:]), self.__getattribute__(p))
+        for name in self._reg_field_names():
+            self._reg_bits_to_raw(getattr(self, name), getattr(self, '_bits_' + name))
 
     @abstractmethod
     def fetch(self):
@@ -97,9 +136,8 @@ class RegBase(ABC):
 
     def __str__(self) -> str:
         ret: str = ''
-        for p in [prop for prop in dir(self) if prop.startswith('_bits_')]:
-            val = self.__getattribute__(p[6:])
-            ret += f' {p[6:]}: 0x{val:x}\n'
+        for name in self._reg_field_names():
+            ret += f' {name}: 0x{getattr(self, name):x}\n'
         return ret
 
 
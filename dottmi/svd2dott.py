@@ -17,8 +17,11 @@
 
 import argparse
 import inspect
+import io
 import os
+import sys
 import textwrap as tw
+import types
 from os.path import basename
 from typing import List, Tuple, TextIO
 
@@ -45,7 +48,8 @@ class SVD2Dott:
 
     @staticmethod
     def _get_node_text(xml, name: str) -> str:
-        nodes = xml.xpath(name)
+        # note: findall (ElementPath) is considerably faster than a full XPath evaluation for simple child paths
+        nodes = xml.findall(name)
         if len(nodes) != 1:
             raise ValueError(f'Exactly 1 node expected for name {name}. Found {len(nodes)} nodes.')
         return str(nodes[0].text).strip()
@@ -76,13 +80,13 @@ class SVD2Dott:
         lsb_last: int | None = None
         msb_last: int | None = None
 
-        for regbits in xml_register.xpath("./fields/field"):
+        for regbits in xml_register.iterfind('fields/field'):
             name: str = self._get_node_text(regbits, "name")
 
-            if len(regbits.xpath('lsb')) > 0:
+            if regbits.find('lsb') is not None:
                 lsb: str = self._get_node_text(regbits, 'lsb')
                 msb: str = self._get_node_text(regbits, 'msb')
-            elif len(regbits.xpath('bitOffset')) > 0:
+            elif regbits.find('bitOffset') is not None:
                 lsb: str = self._get_node_text(regbits, 'bitOffset')
                 bit_width: str = self._get_node_text(regbits, 'bitWidth')
                 msb: str = f'{du.cast_str(lsb) + du.cast_str(bit_width) - 1}'
@@ -105,7 +109,7 @@ class SVD2Dott:
             name_last: str = name
 
     def _emit_registers(self, f: TextIO, xml_peripheral, peripheral_base_addr: int) -> None:
-        for register in xml_peripheral.xpath('./registers/register'):
+        for register in xml_peripheral.iterfind('registers/register'):
             name: str = self._get_node_text(register, 'name')
             try:
                 access: str = self._get_node_text(register, 'access')
@@ -176,10 +180,23 @@ class SVD2Dott:
         Reads the XML file set in the constructor and writes the DOTT register file to the file
         specified in the constructor.
         """
+        with open(self._out_file, 'w', encoding='ascii', newline=self._newline) as f:
+            self._generate(f)
+
+    def generate_source(self) -> str:
+        """
+        Reads the XML file set in the constructor and returns the DOTT register file content as string (instead of
+        writing it to the output file).
+        """
+        with io.StringIO(newline=self._newline) as f:
+            self._generate(f)
+            return f.getvalue()
+
+    def _generate(self, f: TextIO) -> None:
         self._merge_peripherals()
 
         if not self._device_name:
-            self._device_name = self._get_node_text(self._svd_xml, "/device/name")
+            self._device_name = self._get_node_text(self._svd_xml.getroot(), 'name')
 
         try:
             license_raw: str = self._svd_xml.find('licenseText').text
@@ -189,29 +206,53 @@ class SVD2Dott:
         except:
             license_raw: str = ''
 
-        with open(self._out_file, 'w', encoding='ascii', newline=self._newline) as f:
-            license_formatted: str = f'"""\r{inspect.cleandoc(license_raw) if license_raw else ""}\r"""{os.linesep}'
-            f.write(inspect.cleandoc(f'''%s
-                # This file is automatically generated from an SVD register description using {basename(__file__)}.
-                # This file is NOT meant to be modified manually!
-
-                import typing
-
-                from dottmi.reg_access import RegBaseDott, DeviceRegsDott, RegBits
-                from dottmi.target import Target
-
-                # Intentionally disable selected pylint warnings.
-                # pylint: disable=line-too-long
-                # pylint: disable=invalid-name
-                # pylint: disable=too-many-instance-attributes
-                # pylint: disable=too-few-public-methods
-                # pylint: disable=too-many-statements
-                # pylint: disable=too-many-lines
-            ''') % license_formatted)
-            f.write(os.linesep)
+        license_formatted: str = f'"""\r{inspect.cleandoc(license_raw) if license_raw else ""}\r"""{os.linesep}'
+        f.write(inspect.cleandoc(f'''%s
+            # This file is automatically generated from an SVD register description using {basename(__file__)}.
+            # This file is NOT meant to be modified manually!
+
+            import typing
+
+            from dottmi.reg_access import RegBaseDott, DeviceRegsDott, RegBits
+            from dottmi.target import Target
+
+            # Intentionally disable selected pylint warnings.
+            # pylint: disable=line-too-long
+            # pylint: disable=invalid-name
+            # pylint: disable=too-many-instance-attributes
+            # pylint: disable=too-few-public-methods
+            # pylint: disable=too-many-statements
+            # pylint: disable=too-many-lines
+        ''') % license_formatted)
+        f.write(os.linesep)
+
+        self._emit_peripherals(f)
+        self._emit_device_registers(f)
+
+
+def build_module(name: str, svd_files: List[str], device_name: str | None = None,
+                 reg_prefix: str | None = None) -> types.ModuleType:
+    """
+    Converts the given SVD file(s) to DOTT register access classes in-memory (i.e., without writing a Python file) and
+    returns them as module. The module is also added to sys.modules such that it can be imported by its name.
+
+    Args:
+        name: (Fully qualified) name of the module.
+        svd_files: SVD input files. The first one is the primary one. The "peripherals" sections of additional files
+                   are merged into the primary SVD file.
+        device_name: Device name. Overrides device name in SVD file.
+        reg_prefix: Register class prefix (default is none).
+
+    Returns:
+        The module containing the generated register access classes.
+    """
+    svd2dott = SVD2Dott(svd_files[0], svd_files[1:], f'<{name}>', device_name, reg_prefix=reg_prefix)
+    src: str = svd2dott.generate_source()
 
-            self._emit_peripherals(f)
-            self._emit_device_registers(f)
+    module = types.ModuleType(name)
+    exec(compile(src, f'<svd2dott {name}>', 'exec'), module.__dict__)
+    sys.modules[name] = module
+    return module
 
 
 def main():
@@ -17,6 +17,7 @@
 ###############################################################################
 
 import logging
+from typing import Dict
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -25,6 +26,7 @@ class BinarySymbols(object):
 
     def __init__(self, target):
         self._target = target
+        self._addr_cache: Dict[str, int] = {}  # symbol name -> address (cache used by addr_of)
 
     def exists(self, sym_name: str) -> bool:
         try:
@@ -32,3 +34,26 @@ class BinarySymbols(object):
             return True
         except Exception as ex:
             return False
+
+    def addr_of(self, sym_name: str) -> int:
+        """
+        Returns the address of the given symbol (e.g., a function or global variable). The address is only resolved
+        once via GDB and is then cached until a new binary is loaded.
+
+        Args:
+            sym_name: Name of the symbol.
+
+        Returns:
+            Address of the symbol.
+        """
+        addr: int | None = self._addr_cache.get(sym_name)
+        if addr is None:
+            addr = self._target.eval(f'&{sym_name}')
+            self._addr_cache[sym_name] = addr
+        return addr
+
+    def clear_cache(self) -> None:
+        """
+        Clears the symbol address cache. This is done automatically when a new binary is loaded.
+        """
+        self._addr_cache.clear()
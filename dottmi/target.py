@@ -18,13 +18,14 @@
 
 from __future__ import annotations  # available from Python 3.7 onwards, default from Python 3.11 onwards
 
+import asyncio
 import logging
 import os
+import re
 import threading
 import time
 import warnings
-from pathlib import Path, PurePosixPath
-from typing import Dict, Union, List, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Dict, Union, List, Tuple, TYPE_CHECKING
 
 import dottmi.utils
 from dottmi.dott import DottHooks
@@ -36,16 +37,44 @@ if TYPE_CHECKING:
 from dottmi.breakpointhandler import BreakpointHandler
 from dottmi.dottexceptions import DottException
 from dottmi.gdb import GdbClient, GdbServer
-from dottmi.gdb_mi import NotifySubscriber
+from dottmi.gdb_mi import GdbMi, NotifySubscriber
 from dottmi.monitor import Monitor
 from dottmi.symbols import BinarySymbols
 from dottmi.target_mem import TargetMem, TargetMemNoAlloc
-from dottmi.utils import cast_str, log
+from dottmi.utils import cast_str, log, InMemoryDebugCapture
 
 logging.basicConfig(level=logging.DEBUG)
 
+# Script with custom GDB commands which is sourced by GDB. Note: GDB expects paths to be POSIX-formatted.
+_GDB_SCRIPT_FILE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gdb_cmds.py').replace(os.sep, '/')
+
+# Event loop used by Target.run_async (created on first use).
+_async_loop: asyncio.AbstractEventLoop | None = None
+
+# Fixed prefixes/suffixes of frequently issued MI commands. Commands are assembled by plain string concatenation
+# which is cheaper than formatting a template on every call (eval is on the hot path).
+_EVAL_PREFIX: str = '-data-evaluate-expression "'
+_CLI_LEGACY_PREFIX: str = '-interpreter-exec console "'
+_CLI_PREFIX: str = '-dott-cli-exec "'
+_CMD_SUFFIX: str = '"'
+
+# MI commands which are known to leave GDB's register cache untouched. Any other MI command (including DOTT's custom
+# MI commands and commands added in the future) is conservatively assumed to (potentially) cause GDB to fetch registers
+# from the target and to store them in its register cache.
+_REG_CACHE_NEUTRAL_CMDS: tuple = ('-break-', '-gdb-set', '-gdb-show', '-gdb-exit', '-file-', '-dott-bp-count')
+# memory accesses with literal addresses do not require GDB to evaluate (register-based) address expressions
+_REG_CACHE_NEUTRAL_MEM_CMD_RE: re.Pattern = re.compile(r'-data-(read|write)-memory-bytes (-o 0 )?(0x[0-9a-fA-F]+|\d+) ')
+
+# IT bits of the Arm Cortex-M xPSR register (IT[1:0] in bits 26:25 and IT[7:2] in bits 15:10).
+_XPSR_IT_BITS_MASK: int = (0b11 << 25) | (0b111111 << 10)
+
 
 class Target(NotifySubscriber):
+    __slots__ = ('_dconf', '_load_elf_file_name', '_symbol_elf_file_name', '_device_name', '_device_endianess',
+                 '_gdb_client', '_gdb_mi', '_debug_capture', '_gdb_server', '_monitor', '_cv_target_state',
+                 '_is_target_running', '_wait_running_cnt', '_wait_halted_cnt', '_async_running_waiters',
+                 '_async_halted_waiters', '_state_change_wait_secs', '_symbols', '_mem', '_bp_handler',
+                 '_startup_delay', '_connect_timeout', '_gdb_client_is_connected', '_reg_cache_dirty')
 
     def __init__(self, gdb_server: GdbServer, gdb_client: GdbClient, monitor: Monitor, dconf: [DottConf | DottConfExt], auto_connect: bool = True) -> None:
         """
@@ -61,6 +90,9 @@ class Target(NotifySubscriber):
         self._device_name: str = dconf.get(DottConf.keys.device_name)
         self._device_endianess: str = dconf.get(DottConf.keys.device_endianess)
         self._gdb_client: GdbClient = gdb_client
+        # GDB MI and debug capture objects are used on hot paths; keep direct references to them
+        self._gdb_mi: GdbMi = gdb_client.gdb_mi
+        self._debug_capture: InMemoryDebugCapture = gdb_client.gdb_mi.debug_capture
         self._gdb_server: GdbServer = gdb_server
         self._monitor: Monitor = monitor
         self._monitor.set_target(self)
@@ -72,6 +104,9 @@ class Target(NotifySubscriber):
         # counters to keep track how many (threads) are lined to for a stage change notifications
         self._wait_running_cnt: int = 0
         self._wait_halted_cnt: int = 0
+        # asyncio events (and their loops) of coroutines waiting for a target state change
+        self._async_running_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._async_halted_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
 
         # Default number of seconds to wait for a target state change (i.e., halt -> running and vice versa) before
         # raising a timeout exception.
@@ -86,8 +121,8 @@ class Target(NotifySubscriber):
         self._bp_handler.start()
 
         # register to get notified if the target state changes
-        self._gdb_client.gdb_mi.response_handler.notify_subscribe(self, 'stopped', None)
-        self._gdb_client.gdb_mi.response_handler.notify_subscribe(self, 'running', None)
+        self._gdb_mi.response_handler.notify_subscribe(self, 'stopped', None)
+        self._gdb_mi.response_handler.notify_subscribe(self, 'running', None)
 
         # delay after device startup / continue
         self._startup_delay: float = 0.0
@@ -98,6 +133,9 @@ class Target(NotifySubscriber):
         # flag which indicates if gdb client is attached to target
         self._gdb_client_is_connected = False
 
+        # flag which indicates if GDB's register cache might hold content which needs to be flushed (e.g., after reset)
+        self._reg_cache_dirty: bool = True
+
         if auto_connect:
             self.gdb_client_connect()
 
@@ -111,20 +149,19 @@ class Target(NotifySubscriber):
                                 'auto-launches JLINK GDB server in singlerun mode.')
 
         # source script with custom GDB commands (custom Python commands executed in GDB context)
-        my_dir = Path(__file__).absolute().parent
-        gdb_script_file = my_dir.joinpath('./gdb_cmds.py')
-
-        # note: GDB expects paths to be POSIX-formatted.
-        gdb_script_file = str(PurePosixPath(gdb_script_file))
-        self.cli_exec_legacy(f'source {gdb_script_file}')  # Note: Sourcing needs to be done with default MI CLI exec
-                                                           #       as only after sourcing the extended CLI exec command
-                                                           #       is available.
+        self.cli_exec_legacy(f'source {_GDB_SCRIPT_FILE}')  # Note: Sourcing needs to be done with default MI CLI exec
+                                                            #       as only after sourcing the extended CLI exec command
+                                                            #       is available.
 
         try:
             # Hook called before connection to GDB server is established.
             DottHooks.exec_gdb_pre_connect_hook(self)
 
             self.exec('-gdb-set mi-async on', timeout=5)
+            # Let GDB negotiate the remote protocol's no-acknowledgement mode (QStartNoAckMode) with the GDB server.
+            # If the server supports it, packets are no longer acknowledged with '+'/'-' which saves a round-trip
+            # per request. Explicitly set to make sure it was not disabled (e.g., by a gdbinit file).
+            self.exec('-gdb-set remote noack-packet auto', timeout=5)
             self.exec(f'-target-select remote {self._gdb_server.addr}:{self._gdb_server.port}', self._connect_timeout)
             self.cli_exec('set mem inaccessible-by-default off', timeout=1)
         except Exception as ex:
@@ -146,7 +183,8 @@ class Target(NotifySubscriber):
         Args: ignore_timeout: Ignore a potential timeout when sending the disconnect command to GDB client.
                               This may be useful when the target has been reset and GDB is not aware of it.
         """
-        if self._gdb_client_is_connected:
+        if self._gdb_client_is_connected and self._gdb_mi is not None and self._gdb_mi.is_alive():
+            # note: if GDB has already exited, there is no point in waiting for the disconnect command to time out
             try:
                 self.cli_exec('disconnect', timeout=1)
             except Exception as ex:
@@ -188,6 +226,7 @@ class Target(NotifySubscriber):
 
             self.exec_noblock('-gdb-exit')
             self._gdb_client = None
+            self._gdb_mi = None
             self._gdb_client_is_connected = False
         if self._gdb_server is not None:
             self._gdb_server.shutdown()
@@ -285,7 +324,47 @@ class Target(NotifySubscriber):
         Returns:
             The evaluation result converted to a suitable Python data type.
         """
-        res = self.exec(f'-data-evaluate-expression "{expr}"', timeout=timeout)
+        res = self.exec(_EVAL_PREFIX + expr + _CMD_SUFFIX, timeout=timeout)
+        return self._eval_res_to_py(expr, res)
+
+    def eval_many(self, exprs: List[str], timeout: float | None = None) -> List[Union[int, float, bool, str, None]]:
+        """
+        Evaluates multiple expressions in one go. Semantically, this is the same as calling eval() for each of the
+        expressions (in the given order). However, all expressions are sent to GDB before waiting for the results.
+        Hence, the round-trip time to GDB is only paid once instead of once per expression.
+        For example:
+          sp, my_var = t.eval_many(['$sp', 'my_var'])
+
+        Args:
+            exprs: List of expressions to be evaluated in the current context of the target.
+            timeout: Optional timeout for waiting for each of the evaluation results.
+
+        Returns:
+            List of evaluation results (in the same order as exprs) converted to suitable Python data types.
+        """
+        self._reg_cache_dirty = True
+        res = self._gdb_mi.write_blocking_batch([_EVAL_PREFIX + expr + _CMD_SUFFIX for expr in exprs], timeout=timeout)
+        return [self._eval_res_to_py(expr, r) for expr, r in zip(exprs, res)]
+
+    def set_and_call(self, assignment: str, call: str, timeout: float | None = None) -> Union[int, float, bool, str, None]:
+        """
+        Evaluates an assignment (or any other expression with side effects) followed by a function call with a
+        single GDB command. The two are combined using C's comma operator which returns the result of the call.
+        For example:
+          res = t.set_and_call('func_ptr = 0x0', 'my_func()')  # same as t.eval('func_ptr = 0x0'); t.eval('my_func()')
+
+        Args:
+            assignment: The expression which is evaluated first (e.g., an assignment).
+            call: The expression which is evaluated second (e.g., a function call). Its result is returned.
+            timeout: Optional timeout for eval call.
+
+        Returns:
+            The evaluation result of call converted to a suitable Python data type.
+        """
+        return self.eval(f'({assignment}, {call})', timeout=timeout)
+
+    @staticmethod
+    def _eval_res_to_py(expr: str, res: Dict | None) -> Union[int, float, bool, str, None]:
         if res is None:
             log.warning(f'Eval of {expr} did not succeed (return value is None)!')
             return None
@@ -294,15 +373,19 @@ class Target(NotifySubscriber):
         ret_val = cast_str(res)
 
         if '<optimized out>' in str(ret_val):
-            log.wadning(f'Accessed entity {expr} is optimized out in the target binary.')
+            log.warning(f'Accessed entity {expr} is optimized out in the target binary.')
 
         return ret_val
 
     def exec(self, cmd: str, timeout: float = None) -> Dict:
-        return self._gdb_client.gdb_mi.write_blocking(cmd, timeout=timeout)
+        if not (cmd.startswith(_REG_CACHE_NEUTRAL_CMDS) or _REG_CACHE_NEUTRAL_MEM_CMD_RE.match(cmd)):
+            self._reg_cache_dirty = True
+        return self._gdb_mi.write_blocking(cmd, timeout=timeout)
 
     def exec_noblock(self, cmd: str) -> int:
-        return self._gdb_client.gdb_mi.write_non_blocking(cmd)
+        if not (cmd.startswith(_REG_CACHE_NEUTRAL_CMDS) or _REG_CACHE_NEUTRAL_MEM_CMD_RE.match(cmd)):
+            self._reg_cache_dirty = True
+        return self._gdb_mi.write_non_blocking(cmd)
 
     def cli_exec_legacy(self, cmd: str, timeout: float | None = None) -> Dict:
         """
@@ -316,7 +399,8 @@ class Target(NotifySubscriber):
 
         Returns: GDB CLI command result string.
         """
-        return self._gdb_client.gdb_mi.write_blocking(f'-interpreter-exec console "{cmd}"', timeout=timeout)
+        self._reg_cache_dirty = True
+        return self._gdb_mi.write_blocking(_CLI_LEGACY_PREFIX + cmd + _CMD_SUFFIX, timeout=timeout)
 
     def cli_exec(self, cmd: str, timeout: float | None = None) -> str:
         """
@@ -328,16 +412,32 @@ class Target(NotifySubscriber):
 
         Returns: GDB CLI command result string.
         """
-        res: Dict = self._gdb_client.gdb_mi.write_blocking(f'-dott-cli-exec "{cmd}"', timeout=timeout)
+        if not cmd.startswith('monitor '):
+            # monitor commands are passed through to the GDB server and don't touch GDB's register cache
+            self._reg_cache_dirty = True
+        res: Dict = self._gdb_mi.write_blocking(_CLI_PREFIX + cmd + _CMD_SUFFIX, timeout=timeout)
         return res['payload']['res']
 
     ###############################################################################################
     # Execution-related target commands
 
 
-    def load(self, load_elf_file_name: str, symbol_elf_file_name: str | None = None, enable_flash: bool = False) -> None:
+    def load(self, load_elf_file_name: str, symbol_elf_file_name: str | None = None, enable_flash: bool = False,
+             skip_if_unchanged: bool = False) -> None:
+        """
+        Loads the given binary onto the target and/or loads the symbols from the given symbol file.
+
+        Args:
+            load_elf_file_name: ELF file to be downloaded to the target (None to only load symbols).
+            symbol_elf_file_name: ELF file with symbol information (None to not load any symbols).
+            enable_flash: Enable download to FLASH memory.
+            skip_if_unchanged: Skip the download if the target memory already holds the content of the ELF file's
+                               loadable sections. The check is done via GDB's compare-sections (i.e., using CRCs
+                               computed by the GDB server). If the check is not possible, the download is performed.
+        """
         self._load_elf_file_name = load_elf_file_name
         self._symbol_elf_file_name = symbol_elf_file_name
+        self._symbols.clear_cache()
 
         if load_elf_file_name is not None:
             self.exec(f'-file-exec-file {self._load_elf_file_name}')
@@ -349,7 +449,21 @@ class Target(NotifySubscriber):
         self.monitor.enable_flash_download(enable_flash)
 
         if load_elf_file_name is not None:
+            if skip_if_unchanged and self._image_matches():
+                log.info(f'Target memory matches {self._load_elf_file_name}. Skipping download.')
+                return
             self.exec('-target-download')
+            self._reg_cache_dirty = True  # GDB writes the entry PC into its register cache on download
+            if self._mem is not None:
+                self._mem.invalidate_cache()
+
+    def _image_matches(self) -> bool:
+        try:
+            res: str = self.cli_exec('compare-sections')
+        except Exception:
+            # e.g., GDB server does not support CRC computation (qCRC packet)
+            return False
+        return 'matched' in res and 'MIS-MATCHED' not in res
 
     def reset(self, flush_reg_cache: bool = True) -> None:
         """
@@ -413,8 +527,14 @@ class Target(NotifySubscriber):
 
         if not halt_in_it_block:
             # check if we have halted in an IT block; if yes, do instruction stepping until we have left the IT block
-            while self.reg_xpsr_in_it_block(self.eval(f'${self.monitor.xpsr_name()}')):
-                self.step_inst()
+            # note: the stepping loop runs in GDB context which avoids a GDB round-trip (and two target state change
+            #       waits) per stepped instruction
+            res = self.exec(f'-dott-step-it-block {self.monitor.xpsr_name()}')
+            if int(res['payload']['steps']) > 0:
+                # each step causes a running and a stopped notification; they were dispatched before the result of
+                # the command was received and need to be processed before the target state is consistent again
+                self.wait_callbacks_processed()
+                self.wait_halted()
 
     def step(self) -> None:
         """
@@ -454,10 +574,14 @@ class Target(NotifySubscriber):
         notify_msg = msg['message']
         if 'stopped' in notify_msg:
             with self._cv_target_state:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[TARGET STOPPED] {msg}; '
-                                                             f'Thread: {threading.current_thread().name}')
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[TARGET STOPPED] {msg}; Thread: {threading.current_thread().name}')
                 self._is_target_running = False
-                self._gdb_client.gdb_mi.debug_capture.record(f'[TARGET STOPPED DONE] {threading.current_thread().name}')
+                self._reg_cache_dirty = True  # GDB fetches (some) registers when the target stops
+                for loop, event in self._async_halted_waiters:
+                    loop.call_soon_threadsafe(event.set)
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[TARGET STOPPED DONE] {threading.current_thread().name}')
             while self._wait_halted_cnt > 0:
                 with self._cv_target_state:
                     self._cv_target_state.notify_all()
@@ -472,10 +596,13 @@ class Target(NotifySubscriber):
 
         elif 'running' in notify_msg:
             with self._cv_target_state:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[TARGET RUNNING] {msg}; '
-                                                             f'Thread: {threading.current_thread().name}')
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[TARGET RUNNING] {msg}; Thread: {threading.current_thread().name}')
                 self._is_target_running = True
-                self._gdb_client.gdb_mi.debug_capture.record(f'[TARGET RUNNING DONE] {threading.current_thread().name}')
+                for loop, event in self._async_running_waiters:
+                    loop.call_soon_threadsafe(event.set)
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[TARGET RUNNING DONE] {threading.current_thread().name}')
             while self._wait_running_cnt > 0:
                 with self._cv_target_state:
                     self._cv_target_state.notify_all()
@@ -516,15 +643,17 @@ class Target(NotifySubscriber):
 
         with self._cv_target_state:
             if self._is_target_running:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[WAIT_HALTED] {threading.current_thread().name}')
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[WAIT_HALTED] {threading.current_thread().name}')
                 self._wait_halted_cnt += 1
                 self._cv_target_state.wait_for(self.is_halted, wait_secs)
                 self._wait_halted_cnt -= 1
             else:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[WAIT_HALTED FALLTHROUGH] {threading.current_thread().name}')
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[WAIT_HALTED FALLTHROUGH] {threading.current_thread().name}')
             if self._is_target_running:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[WAIT_HALTED FAILED] {threading.current_thread().name}')
-                self._gdb_client.gdb_mi.debug_capture.dump()
+                self._debug_capture.record(f'[WAIT_HALTED FAILED] {threading.current_thread().name}')
+                self._debug_capture.dump()
                 raise DottException(f'Target did not change to "halted" state within {wait_secs} seconds.'
                                     f'Thread: {threading.current_thread().name}')
 
@@ -541,18 +670,99 @@ class Target(NotifySubscriber):
 
         with self._cv_target_state:
             if not self._is_target_running:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[WAIT_RUNNING] {threading.current_thread().name}')
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[WAIT_RUNNING] {threading.current_thread().name}')
                 self._wait_running_cnt += 1
                 self._cv_target_state.wait_for(self.is_running, wait_secs)
                 self._wait_running_cnt -= 1
             else:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[WAIT_RUNNING FALLTHROUGH] {threading.current_thread().name}')
+                if self._debug_capture.enabled:
+                    self._debug_capture.record(f'[WAIT_RUNNING FALLTHROUGH] {threading.current_thread().name}')
             if not self._is_target_running:
-                self._gdb_client.gdb_mi.debug_capture.record(f'[WAIT_RUNNING FAILED] {threading.current_thread().name}')
-                self._gdb_client.gdb_mi.debug_capture.dump()
+                self._debug_capture.record(f'[WAIT_RUNNING FAILED] {threading.current_thread().name}')
+                self._debug_capture.dump()
                 raise DottException(f'Target did not change to "running" state within {wait_secs} seconds.'
                                     f'Thread: {threading.current_thread().name}')
 
+    def wait_until(self, pred: Callable[[], bool], timeout: float = 1.0, poll: float = 0.005) -> None:
+        """
+        Lets the target run until the given predicate becomes True. The target is halted every poll seconds to evaluate
+        the predicate (e.g., lambda: dt.eval('my_counter') > 10) and is continued if the predicate is not yet True.
+        In contrast to a fixed delay between cont and halt, this returns as soon as the condition is met.
+        The target is halted when the function returns.
+
+        Args:
+            pred: Predicate which is evaluated while the target is halted.
+            timeout: Number of seconds to wait for the predicate to become True before a DottException is thrown.
+            poll: Number of seconds the target runs between two evaluations of the predicate.
+        """
+        deadline: float = time.monotonic() + timeout
+        while True:
+            self.cont()
+            time.sleep(poll)
+            self.halt()
+            if pred():
+                return
+            if time.monotonic() >= deadline:
+                raise DottException(f'Condition was not met within {timeout} seconds.')
+
+    async def _wait_state_async(self, running: bool, wait_secs: float | None) -> None:
+        if not wait_secs:
+            wait_secs = self._state_change_wait_secs
+
+        waiters = self._async_running_waiters if running else self._async_halted_waiters
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cv_target_state:
+            if self._is_target_running == running:
+                return
+            waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), wait_secs)
+        except asyncio.TimeoutError:
+            state: str = 'running' if running else 'halted'
+            raise DottException(f'Target did not change to "{state}" state within {wait_secs} seconds.') from None
+        finally:
+            with self._cv_target_state:
+                waiters.remove(waiter)
+
+    async def wait_halted_async(self, wait_secs: float | None = None) -> None:
+        """
+        Coroutine version of wait_halted. Waiting does not block a thread which allows to, e.g., wait for multiple
+        targets concurrently from a single thread (see run_async).
+
+        Args:
+            wait_secs: Number of seconds to wait before a DottException is thrown.
+        """
+        await self._wait_state_async(False, wait_secs)
+
+    async def wait_running_async(self, wait_secs: float | None = None) -> None:
+        """
+        Coroutine version of wait_running. Waiting does not block a thread which allows to, e.g., wait for multiple
+        targets concurrently from a single thread (see run_async).
+
+        Args:
+            wait_secs: Number of seconds to wait before a DottException is thrown.
+        """
+        await self._wait_state_async(True, wait_secs)
+
+    @staticmethod
+    def run_async(coro: Awaitable) -> Any:
+        """
+        Runs the given coroutine on DOTT's asyncio event loop and returns its result. For example:
+          Target.run_async(asyncio.gather(t1.wait_halted_async(), t2.wait_halted_async()))
+
+        Args:
+            coro: Coroutine (or other awaitable) to be run.
+
+        Returns:
+            The result of the coroutine.
+        """
+        global _async_loop
+        if _async_loop is None or _async_loop.is_closed():
+            _async_loop = asyncio.new_event_loop()
+        return _async_loop.run_until_complete(coro)
+
     ###############################################################################################
     # Breakpoint-related target commands
 
@@ -562,8 +772,9 @@ class Target(NotifySubscriber):
         self.monitor.clear_all_breakpoints()
 
     def bp_get_count(self) -> int:
-        res = self.exec('-break-list')
-        cnt = int(res['payload']['BreakpointTable']['nr_rows'])
+        # note: only the count is returned by GDB (instead of the full table as returned by -break-list)
+        res = self.exec('-dott-bp-count')
+        cnt = int(res['payload']['count'])
         return cnt
 
     def _bp_get_list(self) -> []:
@@ -594,8 +805,13 @@ class Target(NotifySubscriber):
         """
         Flush GDB's internal register cache. This command is useful if the target's state was changed in a way that
         is outside the control/awareness of GDB.
+        The flush is skipped if GDB did not (potentially) read any registers since the last flush as there is nothing
+        to be flushed in this case.
         """
+        if not self._reg_cache_dirty:
+            return
         self.cli_exec('flushregs')
+        self._reg_cache_dirty = False
 
     def reg_xpsr_to_str(self, xpsr: int) -> str:
         """
@@ -632,6 +848,4 @@ class Target(NotifySubscriber):
 
         Returns: Returns True if target is executing an IT block, false otherwise.
         """
-        if (xpsr & (0b11 << 25)) >> 25 > 0 or (xpsr & (0b111111 << 10)) >> 10 > 0:
-            return True
-        return False
+        return (xpsr & _XPSR_IT_BITS_MASK) != 0
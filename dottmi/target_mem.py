@@ -18,11 +18,12 @@
 
 from __future__ import annotations  # available from Python 3.7 onwards, default from Python 3.11 onwards
 
+import array
 import binascii
 import math
 import struct
 from enum import Enum
-from typing import Union, Dict, List, TYPE_CHECKING
+from typing import Union, Dict, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from dottmi.target import Target
@@ -155,9 +156,43 @@ class TargetMem(object):
         self._target_mem_base_addr: int = target_mem_start_addr
         self._target_mem_num_bytes: int = target_mem_num_bytes
         self._zero_mem = zero_mem
+        self._ro_ranges: List[Tuple[int, int]] = []  # read-only (start, end) address ranges whose reads are cached
+        self._ro_cache: Dict[Tuple[int, int], bytes] = {}  # (address, num_bytes) -> bytes read from read-only range
         self.reset()
 
+    def add_readonly_range(self, start_addr: int, num_bytes: int) -> None:
+        """
+        Registers a target memory range which is not modified while tests are running (e.g., code in flash or
+        constant system registers such as SCB.CPUID). Reads which are entirely within such a range are cached and are
+        only sent to the target once. The cache is invalidated when a new binary is loaded, when DOTT writes to the
+        range or when invalidate_cache is called. Note that DOTT is not able to detect modifications of the range
+        performed by the target itself or via eval (e.g., 'my_var = 42').
+
+        Args:
+            start_addr: Start address of the read-only memory range.
+            num_bytes: Size of the read-only memory range in bytes.
+        """
+        self._ro_ranges.append((start_addr, start_addr + num_bytes))
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops all cached reads from read-only memory ranges (see add_readonly_range).
+        """
+        self._ro_cache.clear()
+
+    def _is_readonly(self, addr: int, num_bytes: int) -> bool:
+        end_addr: int = addr + num_bytes
+        for start, end in self._ro_ranges:
+            if start <= addr and end_addr <= end:
+                return True
+        return False
+
     def _write_raw(self, dst_addr: Union[int, str, TypedPtr], values: bytes) -> None:
+        if self._ro_cache:
+            # note: writes with symbolic destination addresses conservatively invalidate the cache
+            if not isinstance(dst_addr, int) \
+                    or any(start < dst_addr + len(values) and dst_addr < end for start, end in self._ro_ranges):
+                self.invalidate_cache()
         content = binascii.hexlify(struct.pack('<%dB' % len(values), *values)).decode('utf8')
         self._target.exec(f'-data-write-memory-bytes {dst_addr} "{content}"')
 
@@ -323,6 +358,13 @@ class TargetMem(object):
             addr_to_read = src_addr.addr
         else:
             raise ValueError('Illegal type for src_addr')
+
+        cache_key: Tuple[int, int] | None = None
+        if self._ro_ranges and self._is_readonly(addr_to_read, num_bytes):
+            cache_key = (addr_to_read, num_bytes)
+            cached: bytes | None = self._ro_cache.get(cache_key)
+            if cached is not None:
+                return cached
         content = ''
 
         while num_remaining > 0:
@@ -332,13 +374,16 @@ class TargetMem(object):
 
             data = self._target.exec(f'-data-read-memory-bytes -o 0 {addr_to_read} {bytes_to_read}')
             buf = data['payload']['memory'][0]['contents']
-            buf_len = len(buf) / 2
+            buf_len = len(buf) >> 1
             content += buf
 
             num_remaining -= buf_len
             addr_to_read += buf_len
 
-        return binascii.unhexlify(content)
+        ret: bytes = binascii.unhexlify(content)
+        if cache_key is not None:
+            self._ro_cache[cache_key] = ret
+        return ret
 
     def read_uint8(self, src_addr: Union[int, str, TypedPtr], cnt: int = 1) -> Union[int, List[int]]:
         """
@@ -352,7 +397,7 @@ class TargetMem(object):
         if cnt <= 0:
             raise ValueError('cnt must be greater than zero,')
         data: bytes = self.read(src_addr, cnt)
-        return DottConvert.bytes_to_uint8(data, byte_order=self._target.byte_order)
+        return DottConvert.bytes_to_uint8(data, byte_order=self._target.byte_order, as_list=True)
 
     def read_uint16(self, src_addr: Union[int, str, TypedPtr], cnt: int = 1) -> Union[int, List[int]]:
         """
@@ -366,7 +411,7 @@ class TargetMem(object):
         if cnt <= 0:
             raise ValueError('cnt must be greater than zero,')
         data: bytes = self.read(src_addr, cnt * 2)
-        return DottConvert.bytes_to_uint16(data, byte_order=self._target.byte_order)
+        return DottConvert.bytes_to_uint16(data, byte_order=self._target.byte_order, as_list=True)
 
     def read_uint32(self, src_addr: Union[int, str, TypedPtr], cnt: int = 1) -> Union[int, List[int]]:
         """
@@ -380,7 +425,7 @@ class TargetMem(object):
         if cnt <= 0:
             raise ValueError('cnt must be greater than zero,')
         data: bytes = self.read(src_addr, cnt * 4)
-        return DottConvert.bytes_to_uint32(data, byte_order=self._target.byte_order)
+        return DottConvert.bytes_to_uint32(data, byte_order=self._target.byte_order, as_list=True)
 
     def read_int8(self, src_addr: Union[int, str, TypedPtr], cnt: int = 1) -> Union[int, List[int]]:
         """
@@ -394,7 +439,7 @@ class TargetMem(object):
         if cnt <= 0:
             raise ValueError('cnt must be greater than zero,')
         data: bytes = self.read(src_addr, cnt)
-        return DottConvert.bytes_to_int8(data, byte_order=self._target.byte_order)
+        return DottConvert.bytes_to_int8(data, byte_order=self._target.byte_order, as_list=True)
 
     def read_int16(self, src_addr: Union[int, str, TypedPtr], cnt: int = 1) -> Union[int, List[int]]:
         """
@@ -408,7 +453,7 @@ class TargetMem(object):
         if cnt <= 0:
             raise ValueError('cnt must be greater than zero,')
         data: bytes = self.read(src_addr, cnt * 2)
-        return DottConvert.bytes_to_int16(data, byte_order=self._target.byte_order)
+        return DottConvert.bytes_to_int16(data, byte_order=self._target.byte_order, as_list=True)
 
     def read_int32(self, src_addr: Union[int, str, TypedPtr], cnt: int = 1) -> Union[int, List[int]]:
         """
@@ -422,7 +467,24 @@ class TargetMem(object):
         if cnt <= 0:
             raise ValueError('cnt must be greater than zero,')
         data: bytes = self.read(src_addr, cnt * 4)
-        return DottConvert.bytes_to_int32(data, byte_order=self._target.byte_order)
+        return DottConvert.bytes_to_int32(data, byte_order=self._target.byte_order, as_list=True)
+
+    def read_array(self, src_addr: Union[int, str, TypedPtr], type_code: str, cnt: int = 1) -> array.array:
+        """
+        Reads cnt values of the given type from the target's memory starting from address src_addr. In contrast to
+        the read_uint32/... functions, values are not converted to individual Python ints/floats but are returned as
+        an array.array which is recommended when reading larger amounts of data.
+
+        :param src_addr: The target's source memory address to read from.
+        :param type_code: Type code of the values to read (see DottConvert.as_array).
+        :param cnt: Number of values to read.
+
+        :return: Returns an array.array containing the values read from the target.
+        """
+        if cnt <= 0:
+            raise ValueError('cnt must be greater than zero,')
+        data: bytes = self.read(src_addr, cnt * array.array(type_code).itemsize)
+        return DottConvert.as_array(data, type_code, byte_order=self._target.byte_order)
 
     def reset(self) -> None:
         """
@@ -15,14 +15,17 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 ###############################################################################
-import _thread
+import array
+import functools
 import logging
 import os
-import signal
+import queue
+import string
 import struct
+import sys
 import threading
 from collections import deque
-from typing import Union, List, Any
+from typing import Union, List, Any, Callable, Dict, Set, Tuple
 
 from dottmi.dottexceptions import DottException
 
@@ -46,362 +49,407 @@ def DOTT_LABEL(name: str) -> str:
 
 
 # -------------------------------------------------------------------------------------------------
-# used as decorator to implement singleton pattern
+# used as decorator to implement singleton pattern. The instance is stored on the class itself and returned by
+# __new__. __init__ is only executed for the first (successful) instantiation. Subclasses of a decorated class get their
+# own instance (both __new__ and __init__ look up the instance on the actual class of the object).
 def singleton(cls):
-    instances = {}
+    orig_new = cls.__new__
+    orig_init = cls.__init__
 
-    def _singleton(*args, **kw):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kw)
-        return instances[cls]
+    def __new__(c, *args, **kw):
+        inst = c.__dict__.get('_singleton_instance')
+        if inst is not None:
+            return inst
+        return orig_new(c) if orig_new is object.__new__ else orig_new(c, *args, **kw)
 
-    return _singleton
+    @functools.wraps(orig_init)
+    def __init__(self, *args, **kw):
+        c = type(self)
+        if c.__dict__.get('_singleton_instance') is not None:
+            return
+        orig_init(self, *args, **kw)
+        c._singleton_instance = self
+
+    cls.__new__ = __new__
+    cls.__init__ = __init__
+    return cls
+
+
+# -------------------------------------------------------------------------------------------------
+_BYTE_ORDER_PREFIX: Dict[str, str] = {'little': '<', 'big': '>'}
+_ITEM_SIZE: Dict[str, int] = {type_code: struct.calcsize(type_code) for type_code in 'IHBihbf'}
+# pre-built Struct objects for single elements, keyed by (type code, byte order)
+_SCALAR_STRUCTS: Dict[Tuple[str, str], struct.Struct] = {
+    (type_code, byte_order): struct.Struct(f'{prefix}{type_code}')
+    for type_code in _ITEM_SIZE for byte_order, prefix in _BYTE_ORDER_PREFIX.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _get_struct(type_code: str, byte_order: str, count: int) -> struct.Struct:
+    """
+    Returns a (cached) pre-compiled Struct object for count elements of the given type and byte order. This avoids
+    building and parsing the format string on every pack/unpack operation. Raises a KeyError if byte_order is not
+    supported.
+    """
+    return struct.Struct(f'{_BYTE_ORDER_PREFIX[byte_order]}{count}{type_code}')
 
 
 # -------------------------------------------------------------------------------------------------
 class DottConvert(object):
     @staticmethod
-    def bytes_to_uint32(data: bytes, byte_order: str = 'little') -> Union[int, List[int]]:
+    def bytes_to_uint32(data: bytes, byte_order: str = 'little', as_list: bool = False,
+                        as_array: bool = False) -> Union[int, Tuple[int, ...], List[int], array.array]:
         """
         This function takes a bytes variable and converts its content to an int, or if data is longer than four
-        bytes, to an int list. The bytes are interpreted as uint32 integers.
+        bytes, to an int tuple. The bytes are interpreted as uint32 integers.
         Args:
             data: Bytes to be converted to int / int list.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+            as_list: Return a list instead of a tuple if data is longer than a single element.
+            as_array: Return an array.array (regardless of the length of data). The conversion is done in one go
+                      without creating a Python object per element. Recommended for large amounts of data.
 
         Returns:
-        An int or an int list if data is longer than four bytes.
+        An int or an int tuple (list if as_list is set) if data is longer than four bytes.
         """
-        if (len(data) % 4) != 0:
-            raise ValueError(f'Data shall have a length which is a multiple of 4!')
-
-        if byte_order == 'little':
-            ret_val = struct.unpack('<%dI' % (len(data) / 4), data)
-        elif byte_order == 'big':
-            ret_val = struct.unpack('>%dI' % (len(data) / 4), data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        if len(ret_val) == 1:
-            return ret_val[0]
-        else:
-            return list(ret_val)
+        return DottConvert._unpack(data, 'I', byte_order, as_list, as_array)
 
     @staticmethod
-    def bytes_to_uint16(data: bytes, byte_order: str = 'little') -> Union[int, List[int]]:
+    def bytes_to_uint16(data: bytes, byte_order: str = 'little', as_list: bool = False,
+                        as_array: bool = False) -> Union[int, Tuple[int, ...], List[int], array.array]:
         """
         This function takes a bytes variable and converts its content to an int, or if data is longer than two
-        bytes, to an int list. The bytes are interpreted as uint16 integers.
+        bytes, to an int tuple. The bytes are interpreted as uint16 integers.
         Args:
             data: Bytes to be converted to int / int list.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+            as_list: Return a list instead of a tuple if data is longer than a single element.
+            as_array: Return an array.array (regardless of the length of data). The conversion is done in one go
+                      without creating a Python object per element. Recommended for large amounts of data.
 
         Returns:
-        An int or an int list if data is longer than two bytes.
+        An int or an int tuple (list if as_list is set) if data is longer than two bytes.
         """
-        if (len(data) % 2) != 0:
-            raise ValueError(f'Data shall have a length which is a multiple of 2!')
-
-        if byte_order == 'little':
-            ret_val = struct.unpack('<%dH' % (len(data) / 2), data)
-        elif byte_order == 'big':
-            ret_val = struct.unpack('>%dH' % (len(data) / 2), data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        if len(ret_val) == 1:
-            return ret_val[0]
-        else:
-            return list(ret_val)
+        return DottConvert._unpack(data, 'H', byte_order, as_list, as_array)
 
     @staticmethod
-    def bytes_to_uint8(data: bytes, byte_order: str = 'little') -> Union[int, List[int]]:
+    def bytes_to_uint8(data: bytes, byte_order: str = 'little', as_list: bool = False,
+                       as_array: bool = False) -> Union[int, Tuple[int, ...], List[int], array.array]:
         """
         This function takes a bytes variable and converts its content to an int, or if data is longer than one
-        byte, to and int list. The bytes are interpreted as uint8 integers.
+        byte, to an int tuple. The bytes are interpreted as uint8 integers.
         Args:
             data: Bytes to be converted to int / int list.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+            as_list: Return a list instead of a tuple if data is longer than a single element.
+            as_array: Return an array.array (regardless of the length of data). The conversion is done in one go
+                      without creating a Python object per element. Recommended for large amounts of data.
 
         Returns:
-        An int or an int list if data is longer than one byte.
+        An int or an int tuple (list if as_list is set) if data is longer than one byte.
         """
-        if byte_order == 'little':
-            ret_val = struct.unpack('<%dB' % (len(data)), data)
-        elif byte_order == 'big':
-            ret_val = struct.unpack('>%dB' % (len(data)), data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        if len(ret_val) == 1:
-            return ret_val[0]
-        else:
-            return list(ret_val)
+        return DottConvert._unpack(data, 'B', byte_order, as_list, as_array)
 
     @staticmethod
-    def bytes_to_int32(data: bytes, byte_order: str = 'little') -> Union[int, List[int]]:
+    def bytes_to_int32(data: bytes, byte_order: str = 'little', as_list: bool = False,
+                       as_array: bool = False) -> Union[int, Tuple[int, ...], List[int], array.array]:
         """
         This function takes a bytes variable and converts its content to an int, or if data is longer than four
-        bytes, to an int list. The bytes are interpreted as int32 integers.
+        bytes, to an int tuple. The bytes are interpreted as int32 integers.
         Args:
             data: Bytes to be converted to int / int list.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+            as_list: Return a list instead of a tuple if data is longer than a single element.
+            as_array: Return an array.array (regardless of the length of data). The conversion is done in one go
+                      without creating a Python object per element. Recommended for large amounts of data.
 
         Returns:
-        An int or an int list if data is longer than four bytes.
+        An int or an int tuple (list if as_list is set) if data is longer than four bytes.
         """
-        if (len(data) % 4) != 0:
-            raise ValueError(f'Data shall have a length which is a multiple of 4!')
-
-        if byte_order == 'little':
-            ret_val = struct.unpack('<%di' % (len(data) / 4), data)
-        elif byte_order == 'big':
-            ret_val = struct.unpack('>%di' % (len(data) / 4), data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        if len(ret_val) == 1:
-            return ret_val[0]
-        else:
-            return list(ret_val)
+        return DottConvert._unpack(data, 'i', byte_order, as_list, as_array)
 
     @staticmethod
-    def bytes_to_int16(data: bytes, byte_order: str = 'little') -> Union[int, List[int]]:
+    def bytes_to_int16(data: bytes, byte_order: str = 'little', as_list: bool = False,
+                       as_array: bool = False) -> Union[int, Tuple[int, ...], List[int], array.array]:
         """
         This function takes a bytes variable and converts its content to an int, or if data is longer than two
-        bytes, to an int list. The bytes are interpreted as int16 integers.
+        bytes, to an int tuple. The bytes are interpreted as int16 integers.
         Args:
             data: Bytes to be converted to int / int list.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+            as_list: Return a list instead of a tuple if data is longer than a single element.
+            as_array: Return an array.array (regardless of the length of data). The conversion is done in one go
+                      without creating a Python object per element. Recommended for large amounts of data.
 
         Returns:
-        An int or an int list if data is longer than two bytes.
+        An int or an int tuple (list if as_list is set) if data is longer than two bytes.
         """
-        if (len(data) % 2) != 0:
-            raise ValueError(f'Data shall have a length which is a multiple of 2!')
-
-        if byte_order == 'little':
-            ret_val = struct.unpack('<%dh' % (len(data) / 2), data)
-        elif byte_order == 'big':
-            ret_val = struct.unpack('>%dh' % (len(data) / 2), data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        if len(ret_val) == 1:
-            return ret_val[0]
-        else:
-            return list(ret_val)
+        return DottConvert._unpack(data, 'h', byte_order, as_list, as_array)
 
     @staticmethod
-    def bytes_to_int8(data: bytes, byte_order: str = 'little') -> Union[int, List[int]]:
+    def bytes_to_int8(data: bytes, byte_order: str = 'little', as_list: bool = False,
+                      as_array: bool = False) -> Union[int, Tuple[int, ...], List[int], array.array]:
         """
         This function takes a bytes variable and converts its content to an int, or if data is longer than one
-        byte, to an int list. The bytes are interpreted as int8 integers.
+        byte, to an int tuple. The bytes are interpreted as int8 integers.
         Args:
             data: Bytes to be converted to int / int list.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+            as_list: Return a list instead of a tuple if data is longer than a single element.
+            as_array: Return an array.array (regardless of the length of data). The conversion is done in one go
+                      without creating a Python object per element. Recommended for large amounts of data.
 
         Returns:
-        An int or an int list if data is longer than two bytes.
+        An int or an int tuple (list if as_list is set) if data is longer than two bytes.
         """
-        if byte_order == 'little':
-            ret_val = struct.unpack('<%db' % (len(data)), data)
-        elif byte_order == 'big':
-            ret_val = struct.unpack('>%db' % (len(data)), data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        if len(ret_val) == 1:
-            return ret_val[0]
-        else:
-            return list(ret_val)
+        return DottConvert._unpack(data, 'b', byte_order, as_list, as_array)
 
     @staticmethod
-    def uint32_to_bytes(data: Union[int, List[int]], byte_order: str = 'little') -> bytes:
+    def uint32_to_bytes(data: Union[int, List[int], array.array], byte_order: str = 'little') -> bytes:
         """
         This function takes either an int or an int list and converts the integer(s) to bytes. The integers are
         interpreted as uint32 integers.
         Args:
-            data: An int or an int list.
+            data: An int, an int list or an array.array. An array.array with a matching type code is serialized in
+                  one go without converting each element individually.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
 
         Returns:
             A bytes object containing the serialized integer data.
         """
-        if isinstance(data, int):
-            data = [data]
-        if byte_order == 'little':
-            ret_val = struct.pack('<%dI' % len(data), *data)
-        elif byte_order == 'big':
-            ret_val = struct.pack('>%dI' % len(data), *data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        return ret_val
+        return DottConvert._pack(data, 'I', byte_order, isinstance(data, int))
 
     @staticmethod
-    def uint16_to_bytes(data: Union[int, List[int]], byte_order: str = 'little') -> bytes:
+    def uint16_to_bytes(data: Union[int, List[int], array.array], byte_order: str = 'little') -> bytes:
         """
         This function takes either an int or an int list and converts the integer(s) to bytes. The integers are
         interpreted as uint16 integers.
         Args:
-            data: An int or an int list.
+            data: An int, an int list or an array.array. An array.array with a matching type code is serialized in
+                  one go without converting each element individually.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
 
         Returns:
             A bytes object containing the serialized integer data.
         """
-        if isinstance(data, int):
-            data = [data]
-        if byte_order == 'little':
-            ret_val = struct.pack('<%dH' % len(data), *data)
-        elif byte_order == 'big':
-            ret_val = struct.pack('>%dH' % len(data), *data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        return ret_val
+        return DottConvert._pack(data, 'H', byte_order, isinstance(data, int))
 
     @staticmethod
-    def uint8_to_bytes(data: Union[int, List[int]], byte_order: str = 'little') -> bytes:
+    def uint8_to_bytes(data: Union[int, List[int], array.array], byte_order: str = 'little') -> bytes:
         """
         This function takes either an int or an int list and converts the integer(s) to bytes. The integers are
         interpreted as uint8 integers.
         Args:
-            data: An int or an int list.
+            data: An int, an int list or an array.array. An array.array with a matching type code is serialized in
+                  one go without converting each element individually.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
 
         Returns:
             A bytes object containing the serialized integer data.
         """
-        if isinstance(data, int):
-            data = [data]
-        if byte_order == 'little':
-            ret_val = struct.pack('<%dB' % len(data), *data)
-        elif byte_order == 'big':
-            ret_val = struct.pack('>%dB' % len(data), *data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        return ret_val
+        return DottConvert._pack(data, 'B', byte_order, isinstance(data, int))
 
     @staticmethod
-    def int32_to_bytes(data: Union[int, List[int]], byte_order: str = 'little') -> bytes:
+    def int32_to_bytes(data: Union[int, List[int], array.array], byte_order: str = 'little') -> bytes:
         """
         This function takes either an int or an int list and converts the integer(s) to bytes. The integers are
         interpreted as int32 integers.
         Args:
-            data: An int or an int list.
+            data: An int, an int list or an array.array. An array.array with a matching type code is serialized in
+                  one go without converting each element individually.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
 
         Returns: A bytes object containing the serialized integer data.
         """
-        if isinstance(data, int):
-            data = [data]
-        if byte_order == 'little':
-            ret_val = struct.pack('<%di' % len(data), *data)
-        elif byte_order == 'big':
-            ret_val = struct.pack('>%di' % len(data), *data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        return ret_val
+        return DottConvert._pack(data, 'i', byte_order, isinstance(data, int))
 
     @staticmethod
-    def int16_to_bytes(data: Union[int, List[int]], byte_order: str = 'little') -> bytes:
+    def int16_to_bytes(data: Union[int, List[int], array.array], byte_order: str = 'little') -> bytes:
         """
         This function takes either an int or an int list and converts the integer(s) to bytes. The integers are
         interpreted as int16 integers.
         Args:
-            data: An int or an int list.
+            data: An int, an int list or an array.array. An array.array with a matching type code is serialized in
+                  one go without converting each element individually.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
 
         Returns: A bytes object containing the serialized integer data.
         """
-        if isinstance(data, int):
-            data = [data]
-        if byte_order == 'little':
-            ret_val = struct.pack('<%dh' % len(data), *data)
-        elif byte_order == 'big':
-            ret_val = struct.pack('>%dh' % len(data), *data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        return ret_val
+        return DottConvert._pack(data, 'h', byte_order, isinstance(data, int))
 
     @staticmethod
-    def int8_to_bytes(data: Union[int, List[int]], byte_order: str = 'little') -> bytes:
+    def int8_to_bytes(data: Union[int, List[int], array.array], byte_order: str = 'little') -> bytes:
         """
         This function takes either an int or an int list and converts the integer(s) to bytes. The integers are
         interpreted as int8 integers.
         Args:
-            data: An int or an int list.
+            data: An int, an int list or an array.array. An array.array with a matching type code is serialized in
+                  one go without converting each element individually.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
 
         Returns: A bytes object containing the serialized integer data.
         """
-        if isinstance(data, int):
-            data = [data]
-        if byte_order == 'little':
-            ret_val = struct.pack('<%db' % len(data), *data)
-        elif byte_order == 'big':
-            ret_val = struct.pack('>%db' % len(data), *data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        return ret_val
+        return DottConvert._pack(data, 'b', byte_order, isinstance(data, int))
 
     @staticmethod
-    def float_to_bytes(data: Union[float, List[float]], byte_order: str = 'little') -> bytes:
+    def float_to_bytes(data: Union[float, List[float], array.array], byte_order: str = 'little') -> bytes:
         """
         This function takes either an float or a float list and converts the float(s) to bytes. The floats are
         interpreted as 32bit floats.
         Args:
-            data: An float or an float list.
+            data: An float, a float list or an array.array. An array.array with type code 'f' is serialized in one
+                  go without converting each element individually.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
 
         Returns: A bytes object containing the serialized float data.
         """
-        if isinstance(data, float):
-            data = [data]
-        if byte_order == 'little':
-            ret_val = struct.pack('<%df' % len(data), *data)
-        elif byte_order == 'big':
-            ret_val = struct.pack('>%df' % len(data), *data)
-        else:
-            raise ValueError(f'Unsupported byte order ({byte_order})!')
-
-        return ret_val
+        return DottConvert._pack(data, 'f', byte_order, isinstance(data, float))
 
     @staticmethod
-    def bytes_to_float(data: bytes, byte_order: str = 'little') -> Union[float, List[float]]:
+    def bytes_to_float(data: bytes, byte_order: str = 'little', as_list: bool = False,
+                       as_array: bool = False) -> Union[float, Tuple[float, ...], List[float], array.array]:
         """
         This function takes a bytes variable and converts its content to a float, or if data is longer than four
-        bytes, to a float list. The bytes are interpreted as 32bit floats.
+        bytes, to a float tuple. The bytes are interpreted as 32bit floats.
         Args:
             data: Bytes to be converted to float / float list.
             byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+            as_list: Return a list instead of a tuple if data is longer than a single element.
+            as_array: Return an array.array (regardless of the length of data). The conversion is done in one go
+                      without creating a Python object per element. Recommended for large amounts of data.
 
         Returns:
-        A float or and float list if data is longer than four bytes.
+        A float or a float tuple (list if as_list is set) if data is longer than four bytes.
         """
-        if (len(data) % 4) != 0:
-            raise ValueError(f'Data shall have a length which is a multiple of 4!')
+        return DottConvert._unpack(data, 'f', byte_order, as_list, as_array)
 
-        if byte_order == 'little':
-            ret_val = struct.unpack('<%df' % (len(data) / 4), data)
-        elif byte_order == 'big':
-            ret_val = struct.unpack('>%df' % (len(data) / 4), data)
-        else:
+    @staticmethod
+    def as_array(data: bytes, type_code: str, byte_order: str = 'little') -> array.array:
+        """
+        This function takes a bytes variable and converts its content to an array.array of the given type in one go,
+        i.e., without creating a Python object per element. Elements are only converted to Python objects when they
+        are accessed. This is recommended for large amounts of data (e.g., memory or register dumps).
+        Args:
+            data: Bytes to be converted.
+            type_code: One of 'I' (uint32), 'H' (uint16), 'B' (uint8), 'i' (int32), 'h' (int16), 'b' (int8)
+                       or 'f' (32bit float).
+            byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+
+        Returns:
+        An array.array containing the converted data.
+        """
+        item_size: int | None = _ITEM_SIZE.get(type_code)
+        if item_size is None:
+            raise ValueError(f'Unsupported type code ({type_code})!')
+        if (len(data) % item_size) != 0:
+            raise ValueError(f'Data shall have a length which is a multiple of {item_size}!')
+        return DottConvert._to_array(data, type_code, byte_order)
+
+    @staticmethod
+    def _unpack(data: bytes, type_code: str, byte_order: str, as_list: bool, as_array: bool) \
+            -> Union[int, float, Tuple, List, array.array]:
+        item_size: int = _ITEM_SIZE[type_code]
+        if (len(data) % item_size) != 0:
+            raise ValueError(f'Data shall have a length which is a multiple of {item_size}!')
+
+        if as_array:
+            return DottConvert._to_array(data, type_code, byte_order)
+
+        count: int = len(data) // item_size
+        try:
+            if count == 1:
+                return _SCALAR_STRUCTS[type_code, byte_order].unpack(data)[0]
+            ret_val = _get_struct(type_code, byte_order, count).unpack(data)
+        except KeyError:
+            raise ValueError(f'Unsupported byte order ({byte_order})!') from None
+
+        return list(ret_val) if as_list else ret_val
+
+    @staticmethod
+    def _pack(data: Union[int, float, List, array.array], type_code: str, byte_order: str, is_scalar: bool) -> bytes:
+        if type(data) == array.array and data.typecode == type_code:
+            # data is already stored in the requested binary format; at most, a byte swap is needed
+            if byte_order not in _BYTE_ORDER_PREFIX:
+                raise ValueError(f'Unsupported byte order ({byte_order})!')
+            if byte_order != sys.byteorder:
+                data = array.array(type_code, data)
+                data.byteswap()
+            return data.tobytes()
+
+        try:
+            if is_scalar:
+                return _SCALAR_STRUCTS[type_code, byte_order].pack(data)
+            return _get_struct(type_code, byte_order, len(data)).pack(*data)
+        except KeyError:
+            raise ValueError(f'Unsupported byte order ({byte_order})!') from None
+
+    @staticmethod
+    def _to_array(data: bytes, type_code: str, byte_order: str) -> array.array:
+        if byte_order not in _BYTE_ORDER_PREFIX:
             raise ValueError(f'Unsupported byte order ({byte_order})!')
+        arr = array.array(type_code, data)
+        if byte_order != sys.byteorder:
+            arr.byteswap()
+        return arr
 
-        if len(ret_val) == 1:
-            return ret_val[0]
-        else:
-            return list(ret_val)
+    @staticmethod
+    def _view(data: bytes, type_code: str, byte_order: str) -> memoryview:
+        item_size: int = _ITEM_SIZE[type_code]
+        if (len(data) % item_size) != 0:
+            raise ValueError(f'Data shall have a length which is a multiple of {item_size}!')
+        if byte_order not in _BYTE_ORDER_PREFIX:
+            raise ValueError(f'Unsupported byte order ({byte_order})!')
+
+        if byte_order == sys.byteorder:
+            return memoryview(data).cast(type_code)
+        # byte order differs from the host's byte order; a (byte-swapped) copy is unavoidable in this case
+        arr = array.array(type_code, data)
+        arr.byteswap()
+        return memoryview(arr)
+
+    @staticmethod
+    def view_uint32(data: bytes, byte_order: str = 'little') -> memoryview:
+        """
+        This function returns a read-only view on the given bytes which interprets them as uint32 integers. In contrast
+        to bytes_to_uint32, no up-front conversion of all elements is done; elements are only converted to Python ints
+        when accessed. If byte_order matches the byte order of the host, no copy of data is made (zero-copy).
+        Args:
+            data: Bytes to be viewed as uint32 integers.
+            byte_order: Either 'little' for little endian (default) or 'big' for big endian.
+
+        Returns:
+        A memoryview which allows indexed access to the uint32 integers.
+        """
+        return DottConvert._view(data, 'I', byte_order)
+
+    @staticmethod
+    def view_uint16(data: bytes, byte_order: str = 'little') -> memoryview:
+        """
+        Same as view_uint32 but interprets the given bytes as uint16 integers.
+        """
+        return DottConvert._view(data, 'H', byte_order)
+
+    @staticmethod
+    def view_int32(data: bytes, byte_order: str = 'little') -> memoryview:
+        """
+        Same as view_uint32 but interprets the given bytes as int32 integers.
+        """
+        return DottConvert._view(data, 'i', byte_order)
+
+    @staticmethod
+    def view_int16(data: bytes, byte_order: str = 'little') -> memoryview:
+        """
+        Same as view_uint32 but interprets the given bytes as int16 integers.
+        """
+        return DottConvert._view(data, 'h', byte_order)
 
 
 # -------------------------------------------------------------------------------------------------
+# characters a string accepted by int() or float() can start with (besides non-ASCII digits and whitespace); this
+# includes the first letters of 'inf', 'infinity' and 'nan'
+_NUMERIC_LEAD_CHARS: frozenset = frozenset('+-.0123456789iInN' + string.whitespace)
+
+
 def cast_str(data: Union[str, bytes]) -> Union[int, float, bool, str]:
     """
     This function attempts to 'smart-cast' data (received from GDB) as string into Python int, float, bool or, if
@@ -415,33 +463,43 @@ def cast_str(data: Union[str, bytes]) -> Union[int, float, bool, str]:
     if type(data) == bytes:
         data = data.decode('ascii')
 
+    # fast path for the most common case, plain decimal integers, which don't need any of the processing below
+    if type(data) == str and data.isascii() and (data.isdigit() or (data[:1] == '-' and data[1:].isdigit())):
+        return int(data)
+
     # single chars are returned by MI in a format like this: "2 '\\002'"
     # if this format is detected, it is split up such that an int is returned
-    if " '" in str(data):
-        data = str(data).split(" '")[0]
+    data_str: str = str(data)
+    if " '" in data_str:
+        data = data_str = data_str.split(" '")[0]
 
-    if 'false' in str(data).lower():
+    data_lower: str = data_str.lower()
+    if 'false' in data_lower:
         return False
-    elif 'true' in str(data).lower():
+    elif 'true' in data_lower:
         return True
 
-    try:
-        if data.startswith('@0x'):
-            # GDB returns CPP references (e.g., "MyFoo& GetInstance();" ) as @0xAABBCCDD). Stripping the leading @ here.
-            data = data.lstrip('@')
-
-        if data.startswith('0x'):
-            tmp = data
-            if ' <' in tmp:
-                # function pointers typically are return in this format '0x0304 <func_name>'
-                tmp = tmp.split(' <')[0]
-            elif ' "' in tmp:
-                # character pointers (char* and sometimes uint8_t*) are return in this format '0x65 ""'
-                tmp = tmp.split(' "')[0]
-            return int(tmp, 16)
-    except Exception:
-        # if the data is not just a 'pure' hex value (e.g., more (string) data after the hex value)
-        pass
+    # dispatch on the leading character(s) such that only hex values need any further scanning
+    c0: str = data_str[:1]
+    if c0 == '@' and data_str.startswith('@0x'):
+        # GDB returns CPP references (e.g., "MyFoo& GetInstance();" ) as @0xAABBCCDD). Stripping the leading @ here.
+        data = data_str = data_str.lstrip('@')
+        c0 = '0'
+
+    if c0 == '0' and data_str[1:2] == 'x':
+        # function pointers typically are return in this format '0x0304 <func_name>' and character pointers
+        # (char* and sometimes uint8_t*) in this format '0x65 ""'; a single partition strips these suffixes
+        tmp, sep, suffix = data_str.partition(' ')
+        if not sep or suffix[:1] in ('<', '"'):
+            try:
+                return int(tmp, 16)
+            except ValueError:
+                # if the data is not just a 'pure' hex value (e.g., more (string) data after the hex value)
+                pass
+
+    if type(data) == str and c0 not in _NUMERIC_LEAD_CHARS and c0.isascii():
+        # data can not be parsed by int() or float(); skip the (comparatively expensive) exception handling below
+        return data  # return as string
 
     for fn in (int, float):
         try:
@@ -457,34 +515,68 @@ def cast_str(data: Union[str, bytes]) -> Union[int, float, bool, str]:
 class BlockingDict(object):
     def __init__(self):
         self._items = {}
-        self._cv = threading.Condition()
+        self._waiters: Dict[Any, threading.Event] = {}
+        self._lock = threading.Lock()
 
     def put(self, key, value):
-        with self._cv:
+        with self._lock:
             self._items[key] = value
-            self._cv.notify_all()
+            # only wake up the waiter (if any) which is waiting for this specific key
+            event = self._waiters.get(key)
+            if event is not None:
+                event.set()
 
     def pop(self, key, timeout: float = None):
-        with self._cv:
-            while key not in self._items:
-                new_item = self._cv.wait(timeout)
-                if not new_item:
-                    # timeout hit
-                    raise TimeoutError
-
+        with self._lock:
+            if key in self._items:
+                return self._items.pop(key)
+            event = self._waiters.get(key)
+            if event is None:
+                event = self._waiters[key] = threading.Event()
+
+        event.wait(timeout)
+
+        with self._lock:
+            if self._waiters.get(key) is event:
+                del self._waiters[key]
+            if key not in self._items:
+                # timeout hit
+                raise TimeoutError
             return self._items.pop(key)
 
 
 # -------------------------------------------------------------------------------------------------
 class Network(object):
 
-    _next_gdb_srv_port: int = 2331
+    # range [start, end) of ports considered by get_next_srv_port
+    _port_range_start: int = 2334
+    _port_range_end: int = 65535
+    _next_gdb_srv_port: int = _port_range_start - 3
+
+    @classmethod
+    def set_port_range(cls, start: int, end: int) -> None:
+        """
+        Restricts the ports considered by get_next_srv_port to the range [start, end). When the end of the range is
+        reached, the search wraps around to the start of the range. This is useful if several processes (e.g.,
+        pytest-xdist workers) launch GDB servers concurrently: giving each process a disjoint port range avoids that
+        they pick the same ports.
+
+        Args:
+            start: First port of the range.
+            end: End of the range (exclusive).
+        """
+        if not (0 < start and start + 3 <= end <= 65535):
+            raise ValueError(f'Invalid port range [{start}, {end}). It must hold at least three ports.')
+        cls._port_range_start = start
+        cls._port_range_end = end
+        cls._next_gdb_srv_port = start - 3
 
     @classmethod
     def get_next_srv_port(cls, srv_addr: str) -> int:
         """
         Find the next triplet of free ("bind-able") TCP ports on the given server IP address.
-        Ports are automatically advanced until a free port triplet is found.
+        Ports are automatically advanced until a free port triplet is found. Only ports in the range set via
+        set_port_range are considered.
 
         Args:
             srv_addr: IP address of the server.
@@ -493,37 +585,75 @@ class Network(object):
         """
         import socket
 
+        # snapshot of the ports which are currently in LISTEN state; this allows to skip busy ports without having to
+        # probe them via bind()
+        busy_ports = cls._get_listening_ports(srv_addr)
+
         port = cls._next_gdb_srv_port + 3
+        if port >= cls._port_range_end:
+            port = cls._port_range_start
         sequentially_free_ports = 0
         start_port = 0
+        wrapped = False
 
         while True:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            try:
-                s.bind((srv_addr, port))
+            if port not in busy_ports:
                 sequentially_free_ports += 1
                 if sequentially_free_ports == 1:
                     start_port = port
-            except socket.error:
-                # log.debug(f'Can not bind port {port} as it is already in use.')
+            else:
                 sequentially_free_ports = 0
-            finally:
-                s.close()
 
             if sequentially_free_ports > 2:
-                # found 3 free ports in a row
-                break
+                # found 3 free ports in a row; confirm that they are actually bind-able
+                failed_port = None
+                for p in range(start_port, start_port + sequentially_free_ports):
+                    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    try:
+                        # note: SO_REUSEADDR is deliberately not set; the actual bind is done by the (external) GDB
+                        # server and a port in TIME_WAIT state has to be reported as busy as it would be to the server
+                        s.bind((srv_addr, p))
+                    except socket.error:
+                        # log.debug(f'Can not bind port {p} as it is already in use.')
+                        failed_port = p
+                        break
+                    finally:
+                        s.close()
+
+                if failed_port is None:
+                    break
+                # restart search right after the port which could not be bound
+                busy_ports.add(failed_port)
+                port = failed_port
+                sequentially_free_ports = 0
 
             port += 1
-            if port >= 65535:
-                raise DottException(f'Unable do find three (consecutive) free ports for IP {srv_addr}!')
+            if port >= cls._port_range_end:
+                if wrapped:
+                    raise DottException(f'Unable do find three (consecutive) free ports for IP {srv_addr} in port '
+                                        f'range [{cls._port_range_start}, {cls._port_range_end})!')
+                # wrap around and continue at the start of the port range
+                wrapped = True
+                port = cls._port_range_start
+                sequentially_free_ports = 0
 
         cls._next_gdb_srv_port = start_port + sequentially_free_ports
-        if cls._next_gdb_srv_port > 65500:
-            # wrap around for next invocation
-            cls._next_gdb_srv_port = 2331
         return start_port
 
+    @staticmethod
+    def _get_listening_ports(srv_addr: str) -> Set[int]:
+        """
+        Returns the set of TCP ports which are in LISTEN state on the given server IP address (or on any address).
+        If the connection table can not be queried (e.g., due to missing privileges), an empty set is returned.
+        """
+        import psutil
+
+        try:
+            return {c.laddr.port for c in psutil.net_connections(kind='tcp')
+                    if c.status == psutil.CONN_LISTEN and c.laddr.ip in (srv_addr, '0.0.0.0', '::', '')}
+        except (psutil.AccessDenied, OSError):
+            return set()
+
 
 # -------------------------------------------------------------------------------------------------
 class InMemoryDebugCapture:
@@ -536,6 +666,9 @@ class InMemoryDebugCapture:
     def __init__(self, enabled: bool = False, num_records: int = 60):
         self._enabled: bool = enabled
         self._capture_queue: deque = deque(maxlen=num_records)
+        # record(entry) records the provided entry in the internal queue. It is directly bound to the queue's append
+        # method (or to a no-op if capturing is disabled) to keep the per-entry overhead as low as possible.
+        self.record: Callable[[Any], None] = self._bind_record(enabled)
 
     @property
     def enabled(self) -> bool:
@@ -552,14 +685,14 @@ class InMemoryDebugCapture:
             enabled: True to enable, False to disable.
         """
         self._enabled = enabled
+        self.record = self._bind_record(enabled)
 
-    def record(self, entry: Any) -> None:
-        """
-        Records the provided entry in the internal queue.
-        :param entry: Entry to be added to the capture queue.
-        """
-        if self._enabled:
-            self._capture_queue.append(entry)
+    def _bind_record(self, enabled: bool) -> Callable[[Any], None]:
+        return self._capture_queue.append if enabled else self._record_noop
+
+    @staticmethod
+    def _record_noop(entry: Any) -> None:
+        pass
 
     def dump(self) -> None:
         """
@@ -575,31 +708,38 @@ class InMemoryDebugCapture:
 class ExceptionPropagator:
     """
     This class provides functionality to propagate exceptions from threads to the main thread.
-    Propagation is implemented by means of signal.SIGABRT which is raised by the sub thread.
+    Exceptions propagated by sub threads are queued and are re-raised when the main thread calls check() at a safe
+    point (e.g., when waiting for a halt point to be reached or at the end of each test function).
     """
-    _exception: Exception | None = None
-    # _exception_lock: threading.Lock = threading.Lock()
-
-    @classmethod
-    def _sig_handler(cls, signum, frame):
-        if cls._exception:
-            raise cls._exception
+    _exceptions: queue.SimpleQueue = queue.SimpleQueue()
 
     @classmethod
     def setup(cls):
         """
-        Sets up the signal handler. Should be called from main thread.
+        Discards any exceptions which were propagated but not checked so far. Should be called from main thread.
         """
-        if threading.current_thread().name != 'MainThread':
-            log.warning('Signal handler setup should be called from main thread!')
-        signal.signal(signal.SIGABRT, cls._sig_handler)
+        if threading.current_thread() is not threading.main_thread():
+            log.warning('Exception propagator setup should be called from main thread!')
+        while not cls._exceptions.empty():
+            cls._exceptions.get_nowait()
 
     @classmethod
     def propagate_exception(cls, exc: Exception):
         """
-        Propagates teh given exception ecx to the main thread. Te setup method is
-        expected to be called before by the main thread.
+        Propagates the given exception exc to the main thread. The exception is raised in the main thread the next
+        time it calls check().
+        """
+        cls._exceptions.put(exc)
+
+    @classmethod
+    def check(cls):
+        """
+        Raises the first exception propagated since the last check. Further pending exceptions are logged and
+        discarded. Does nothing if not called from main thread.
         """
-        cls._exception = exc
-        signal.raise_signal(signal.SIGABRT)
-        # assert cls._exception == None
+        if cls._exceptions.empty() or threading.current_thread() is not threading.main_thread():
+            return
+        exc: Exception = cls._exceptions.get_nowait()
+        while not cls._exceptions.empty():
+            log.error('Additional exception propagated from thread:', exc_info=cls._exceptions.get_nowait())
+        raise exc
@@ -35,8 +35,8 @@ except:
     pass
 
 # set binaries used for the tests in this folder (relative to main conftest file)
-DottConf.conf['app_load_elf'] = f'02_system_testing/target/build/dott_example_02{postfix}/dott_example_02{postfix}.bin.elf'
-DottConf.conf['app_symbol_elf'] = f'02_system_testing/target/build/dott_example_02{postfix}/dott_example_02{postfix}.elf'
+DottConf.update({'app_load_elf': f'02_system_testing/target/build/dott_example_02{postfix}/dott_example_02{postfix}.bin.elf',
+                 'app_symbol_elf': f'02_system_testing/target/build/dott_example_02{postfix}/dott_example_02{postfix}.elf'})
 
 def setup_cb() -> None:
     """
@@ -16,7 +16,7 @@
 ###############################################################################
 
 from dottmi.dott import DottConf
-from dottmi.fixtures import target_load_flash, target_reset_flash
+from dottmi.fixtures import target_load_flash, target_reset_flash, target_reset_flash_once
 
 # set binaries used for the tests in this folder (relative to main conftest file)
 DottConf.conf[DottConf.keys.app_load_elf] = f'01_component_testing/target/build/dott_example_01/dott_example_01.bin.elf'
@@ -26,6 +26,7 @@ DottConf.conf[DottConf.keys.on_target_mem_model] = 'NOALLOC'
 # re-target target_reset/load fixtures
 target_load = target_load_flash
 target_reset = target_reset_flash
+target_reset_once = target_reset_flash_once
 
 
 def pytest_configure(config):
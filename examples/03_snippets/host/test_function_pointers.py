@@ -30,20 +30,20 @@ class TestFunctionPointers:
 
         # When setting the function pointer directly to an address, the lest significant bit needs to be
         # set to make the function pointer valid in Thumb mode.
-        ptr = dt.eval('&example_GetA')
-        dt.eval(f'func_a = {ptr | 0x00000001}')
-        res = dt.eval('example_FunctionPointers()')
+        # Note: Setting the pointer and calling the function is done with set_and_call which combines both into a
+        #       single expression (using C's comma operator) and hence needs only one GDB command.
+        # Note: The symbol address is only resolved once (via GDB) and is then cached by DOTT.
+        ptr = dt.symbols.addr_of('example_GetA')
+        res = dt.set_and_call(f'func_a = {ptr | 0x00000001}', 'example_FunctionPointers()')
         assert res == 62
 
         # The function pointer can be (re-)set to NULL via direct assignment
-        dt.eval(f'func_a = {0x0}')
-        res = dt.eval('example_FunctionPointers()')
+        res = dt.set_and_call(f'func_a = {0x0}', 'example_FunctionPointers()')
         assert res == 30
 
         # When setting the function pointer via a setter function (which takes a function pointer parameter)
         # GDB automatically sets the thumb bit.
-        dt.eval(f'reg_func_ptr_param({ptr})')
-        res = dt.eval('example_FunctionPointers()')
+        res = dt.set_and_call(f'reg_func_ptr_param({ptr})', 'example_FunctionPointers()')
         assert res == 62
 
         # IMPORTANT Note:
@@ -59,23 +59,20 @@ class TestFunctionPointers:
         # When setting the function pointer directly to NULL (instead of using the setter function), either
         # with eval() or mem.write(), GDB does NOT automatically set the Thumb bit.
 
-        dt.eval(f'reg_func_ptr_param({0x0})')
-        assert dt.eval(f'func_a') == 0x1  # thumb bit was set by GBB
+        _, func_a = dt.eval_many([f'reg_func_ptr_param({0x0})', 'func_a'])
+        assert func_a == 0x1  # thumb bit was set by GBB
 
         # The function pointer can be (re-)set to NULL via direct assignment.
-        dt.eval(f'func_a = {0x0}')
-        assert dt.eval('func_a') == 0x0  # thumb bit was NOT set by GBB
-        res = dt.eval('example_FunctionPointers()')
+        _, func_a, res = dt.eval_many([f'func_a = {0x0}', 'func_a', 'example_FunctionPointers()'])
+        assert func_a == 0x0  # thumb bit was NOT set by GBB
         assert res == 30
 
         # When setting the function pointer via 'hardcoded' setter function, GCC already sets the thumb bit.
-        dt.eval(f'reg_func_ptr_a()')
-        assert (dt.eval('&example_GetA') & 0x1) == 0x0  # function address has LSBit == 0
-        assert (dt.eval('func_a') & 0x1) == 0x1  # function pointer set
-        res = dt.eval('example_FunctionPointers()')
+        _, func_a, res = dt.eval_many(['reg_func_ptr_a()', 'func_a', 'example_FunctionPointers()'])
+        assert (ptr & 0x1) == 0x0  # function address has LSBit == 0
+        assert (func_a & 0x1) == 0x1  # function pointer set
         assert res == 62
 
         # Also setting to NULL via 'hardcoded' setter function actually sets the function pointer to NULL (0x0).
-        dt.eval(f'reg_func_ptr_null()')
-        res = dt.eval('example_FunctionPointers()')
+        res = dt.set_and_call('reg_func_ptr_null()', 'example_FunctionPointers()')
         assert res == 30
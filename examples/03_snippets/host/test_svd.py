@@ -14,27 +14,40 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 ###############################################################################
-import glob
 import os
-import subprocess
-import time
+import sys
+from pathlib import Path
+from typing import List
 
 import pytest
 
 from dottmi.dott import dott
+from dottmi.svd2dott import build_module
 from dottmi.utils import log
 
+# SVD input files (relative to the main conftest file)
+_SVD_DIR: Path = Path('03_snippets/host/data')
+_SVD_STM32F072X: str = os.fspath(_SVD_DIR / 'STM32F072x.svd')
+_SVD_CORTEX_M0: str = os.fspath(_SVD_DIR / 'Cortex-M0.svd')
+
+# names of the register access modules generated by setup_module
+_GENERATED: List[str] = []
+
+
+def _build_module(name: str, svd_files: List[str], **kwargs) -> None:
+    _GENERATED.append(build_module(f'{__package__}.{name}', svd_files, **kwargs).__name__)
+
 
 def setup_module(request):
     """
-    Generate all register access classes required by the tests.
+    Generate all register access classes required by the tests. The classes are generated in-memory and registered
+    as modules of this package (i.e., they are imported as if they had been generated into files next to this file).
     """
-    TestSvd.create_reg_file('regs_stm32f072x.py')
-    TestSvd.create_reg_file('regs_prefix_stm32f072x.py', args='-r Reg_')
-    TestSvd.create_reg_file('regs_device_stm32f072x.py', args='-d Nucleo')
-    TestSvd.create_reg_file('regs_merged_stm32f072x.py',
-                            in_file='03_snippets/host/data/STM32F072x.svd 03_snippets/host/data/Cortex-M0.svd')
-    TestSvd.create_reg_file('regs_cortexm0.py', in_file=f'03_snippets/host/data/Cortex-M0.svd')
+    _build_module('regs_stm32f072x', [_SVD_STM32F072X])
+    _build_module('regs_prefix_stm32f072x', [_SVD_STM32F072X], reg_prefix='Reg_')
+    _build_module('regs_device_stm32f072x', [_SVD_STM32F072X], device_name='Nucleo')
+    _build_module('regs_merged_stm32f072x', [_SVD_STM32F072X, _SVD_CORTEX_M0])
+    _build_module('regs_cortexm0', [_SVD_CORTEX_M0])
 
 
 def teardown_module(request):
@@ -46,29 +59,15 @@ def teardown_module(request):
     Returns:
 
     """
-    for f in glob.glob('03_snippets/host/regs_*.py'):
-        os.remove(f)
+    for name in _GENERATED:
+        sys.modules.pop(name, None)
+    _GENERATED.clear()
 
 
 class TestSvd:
-    @staticmethod
-    def create_reg_file(out_file: str, in_file: str | None = None, args: str = '') -> None:
-        out_name: str = f'03_snippets/host/{out_file}'
-        in_name: str = in_file if in_file else '03_snippets/host/data/STM32F072x.svd'
-        if os.path.exists(out_name):
-            os.remove(out_name)
-
-        if os.environ.get('JENKINS_HOME'):
-            log.debug('Running on Jenkins.')
-            pptmp = os.environ.get('PYTHONPATH')
-            os.environ['PYTHONPATH'] = ''
-            os.system(f'svd2dott -i {in_name} -o {out_name} {args}')
-            os.environ['PYTHONPATH'] = pptmp
-        else:
-            log.debug('NOT running on Jenkins.')
-            os.system(f'python ../dottmi/svd2dott.py -i {in_name} -o {out_name} {args}')
-
-    def test_stm32f072(self, target_load, target_reset):
+    # note: Tests which only read registers share a single (class-scoped) target reset. Tests which modify the target
+    #       state use the function-scoped target_reset fixture. test_reset triggers a system reset and is kept last.
+    def test_stm32f072(self, target_load, target_reset_once):
         """
         Access registers on STM32 and checks if they are having the expected reset value.
         """
@@ -76,14 +75,13 @@ class TestSvd:
 
         stm32_regs = STM32F072xRegisters()
 
-        stm32_regs.CFGR.fetch()
+        stm32_regs.fetch_many(stm32_regs.CFGR, stm32_regs.PRER)
         log.debug('0x%x' % stm32_regs.CFGR.raw)
         assert stm32_regs.CFGR.raw == 0x2022bb7f
-        stm32_regs.PRER.fetch()
         log.debug('0x%x' % stm32_regs.PRER.raw)
         assert stm32_regs.PRER.raw == 0x007F00FF
 
-    def test_stm32f072_prefix(self, target_load, target_reset):
+    def test_stm32f072_prefix(self, target_load, target_reset_once):
         """
         Same test as previous one but using prefix for registers (supplied via command line parameter).
         """
@@ -91,14 +89,13 @@ class TestSvd:
 
         stm32_regs = STM32F072xRegisters()
 
-        stm32_regs.Reg_CFGR.fetch()
+        stm32_regs.fetch_many(stm32_regs.Reg_CFGR, stm32_regs.Reg_PRER)
         log.debug('0x%x' % stm32_regs.Reg_CFGR.raw)
         assert stm32_regs.Reg_CFGR.raw == 0x2022bb7f
-        stm32_regs.Reg_PRER.fetch()
         log.debug('0x%x' % stm32_regs.Reg_PRER.raw)
         assert stm32_regs.Reg_PRER.raw == 0x007F00FF
 
-    def test_stm32f072_device(self, target_load, target_reset):
+    def test_stm32f072_device(self, target_load, target_reset_once):
         """
         same test as previous one but using device name (supplied via command line paramter).
         """
@@ -106,14 +103,13 @@ class TestSvd:
 
         stm32_regs = NucleoRegisters()
 
-        stm32_regs.CFGR.fetch()
+        stm32_regs.fetch_many(stm32_regs.CFGR, stm32_regs.PRER)
         log.debug('0x%x' % stm32_regs.CFGR.raw)
         assert stm32_regs.CFGR.raw == 0x2022bb7f
-        stm32_regs.PRER.fetch()
         log.debug('0x%x' % stm32_regs.PRER.raw)
         assert stm32_regs.PRER.raw == 0x007F00FF
 
-    def test_svd2dott_merge(self, target_load, target_reset):
+    def test_svd2dott_merge(self, target_load, target_reset_once):
         """
         Creates register access class from two SVD files which are merged.
         """
@@ -123,14 +119,13 @@ class TestSvd:
         stm32_regs.AIRCR.fetch()
         log.debug('0x%x' % stm32_regs.AIRCR.raw)
 
-        stm32_regs.CFGR.fetch()
+        stm32_regs.fetch_many(stm32_regs.CFGR, stm32_regs.PRER)
         log.debug('0x%x' % stm32_regs.CFGR.raw)
         assert stm32_regs.CFGR.raw == 0x2022bb7f
-        stm32_regs.PRER.fetch()
         log.debug('0x%x' % stm32_regs.PRER.raw)
         assert stm32_regs.PRER.raw == 0x007F00FF
 
-    def test_cpuid(self, target_load, target_reset):
+    def test_cpuid(self, target_load, target_reset_once):
         """
         Creates register access class from two SVD files which are merged. Reads out and checks the CPUID register.
         """
@@ -178,11 +173,8 @@ class TestSvd:
         dt = dott().target
         stm32_regs = STM32F072xRegisters(dt)
 
-        dt.cont()
-        time.sleep(1)
-        dt.halt()
-
         # note: global_data is initialized to 0xdeadbeef in firmware and then gets incremented in main loop
+        dt.wait_until(lambda: dt.eval('global_data') > 0xdeadbeef, timeout=1.0)
         gd = dt.eval('global_data')
         assert gd > 0xdeadbeef
 
@@ -199,9 +191,7 @@ class TestSvd:
         # note: commit done automatically
 
         # let target run and initialize
-        dt.cont()
-        time.sleep(1)
-        dt.halt()
+        dt.wait_until(lambda: dt.eval('global_data') > 0xdeadbeef, timeout=1.0)
 
         # global_data is expected to have been initialized again to deadbeef and incremented from there
         gd = dt.eval('global_data')
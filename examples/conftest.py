@@ -19,42 +19,65 @@
 import logging
 import os
 import socket
-
-import pigpio
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 from dottmi.dott import dott, Dott
-from dottmi.fixtures import dott_auto_func_cleanup, target_reset_common, pytest_configure
+from dottmi.fixtures import dott_auto_func_cleanup, target_reset_common, pytest_configure, pytest_runtest_call
 # set working directory to the folder which contains this conftest file
 import pytest
 
 from dottmi.dott import DottConf
+from dottmi.utils import Network
+
+# folder which contains this conftest file (resolved once)
+_HERE: Path = Path(__file__).resolve().parent
 
-os.chdir(os.path.dirname(os.path.realpath(__file__)))
+os.chdir(_HERE)
 
 # silence the debug output from matplotlib
 logging.getLogger('matplotlib').setLevel(logging.WARNING)
 
 
-def set_config_options() -> None:
-    # machine-specific settings (selected based on hostname)
-    hostname = socket.gethostname()
+# machine-specific settings (selected based on lower-case hostname)
+_HOST_CONFIG: Dict[str, Dict[str, str]] = {
+    # running on JENKINS node
+    'dott': {'pigpio_addr': 'rpidott02',  # PiGPIO daemon on RaspberryPI (rpidott02)
+             'jlink_serial': '51014146'},
+    # development machine
+    'thunder': {},
+    # 'your_host_name': {'gdb_server_addr': 'WWW.XXX.YYY.ZZZ',  # only needed for a remote JLINK connected to RaspberryPI
+    #                    'pigpio_addr': 'AAA.BBB.CCC.DDD'},  # remote PiGPIO daemon on RaspberryPI
+}
 
-    # General options
-    DottConf.set('jlink_script', 'test.jlinkscript')
-    DottConf.set('jlink_extconf', '-log jlink_log.txt')
 
-    if hostname.lower() == 'dott':
-        # running on JENKINS node
-        DottConf.set('pigpio_addr', 'rpidott02')  # PiGPIO daemon on RaspberryPI (rpidott02)
-        DottConf.set('jlink_serial', '51014146')
+# ports used for GDB servers launched by DOTT; split among pytest-xdist workers
+_GDB_SRV_PORT_RANGE: Tuple[int, int] = (2334, 65535)
 
-    elif hostname.lower() == 'thunder':
-        # development machine
-        pass
 
-#    elif hostname == 'YOUR_HOST_NAME':
-#        DottConf.set('gdb_server_addr', 'WWW.XXX.YYY.ZZZ')  # only needed for a remote JLINK connected to RaspberryPI
-#        DottConf.set('pigpio_addr', 'AAA.BBB.CCC.DDD')  # remote PiGPIO daemon on RaspberryPI
+def set_config_options() -> None:
+    # General options
+    DottConf.update({'jlink_script': 'test.jlinkscript',
+                     'jlink_extconf': '-log jlink_log.txt'})
+
+    DottConf.update(_HOST_CONFIG.get(socket.gethostname().lower(), {}))
+
+    # When running tests in parallel with pytest-xdist (e.g., pytest -n 2), each worker needs its own J-Link probe.
+    # The probes are given as comma-separated list of serial numbers (e.g., DOTT_JLINK_SERIALS=51014146,51014147)
+    # and worker gw<N> uses the N-th probe. Without pytest-xdist only the first probe is used.
+    # Each worker also searches for free GDB server ports in its own (disjoint) share of the port range. Otherwise,
+    # workers which start their GDB servers at the same time would pick the same ports.
+    jlink_serials: List[str] = [s.strip() for s in os.environ.get('DOTT_JLINK_SERIALS', '').split(',') if s.strip()]
+    if jlink_serials:
+        worker_idx: int = int(os.environ.get('PYTEST_XDIST_WORKER', 'gw0')[2:])
+        if worker_idx >= len(jlink_serials):
+            raise ValueError(f'No J-Link probe for pytest-xdist worker {worker_idx} (DOTT_JLINK_SERIALS only lists '
+                             f'{len(jlink_serials)} probes). Reduce the number of workers or add probes.')
+        DottConf.set('jlink_serial', jlink_serials[worker_idx])
+        worker_cnt: int = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', '1'))
+        ports_per_worker: int = (_GDB_SRV_PORT_RANGE[1] - _GDB_SRV_PORT_RANGE[0]) // worker_cnt
+        port_start: int = _GDB_SRV_PORT_RANGE[0] + worker_idx * ports_per_worker
+        Network.set_port_range(port_start, port_start + ports_per_worker)
 
 
 # set host-specific parameters
@@ -76,6 +99,9 @@ def i2c_comm() -> CommDev:
     Returns:
         Return a CommDev instance.
     """
+    # note: pigpio is imported here (and not at module level) since it is only needed by the I2C tests
+    import pigpio
+
     dott().target.startup_delay = .05
     pi = pigpio.pi(DottConf.conf['pigpio_addr'])
     # open I2C bus 1, set I2C device slave address to 0x40
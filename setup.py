@@ -19,16 +19,19 @@
 import glob
 import hashlib
 import os
+import re
 import shlex
 import shutil
 import ssl
 import stat
+import struct
 import subprocess
 import sys
 import urllib.request
 import tarfile
 import zipfile
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 from zipfile import ZipFile
 from datetime import date
 
@@ -41,6 +44,78 @@ if build_version is None:
     build_version = f'{date.today().strftime("%Y%m%d")}'
 
 
+def _file_sha256(file_name: str) -> str:
+    # hash file in chunks (instead of reading the whole, potentially large, file into memory)
+    with open(file_name, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _verified_key(file_name: str, sha256: str) -> str:
+    st = os.stat(file_name)
+    return f'{st.st_size}:{st.st_mtime_ns}:{sha256}'
+
+
+def _mark_verified(file_name: str, sha256: str) -> None:
+    # sidecar file remembering that the file (with this size and mtime) has been verified; a re-download changes the
+    # mtime and thereby invalidates the sidecar
+    with open(f'{file_name}.ok', 'w') as f:
+        f.write(_verified_key(file_name, sha256))
+
+
+def _is_verified(file_name: str, sha256: str) -> bool:
+    # check sidecar first to avoid re-hashing large, unchanged files on incremental builds
+    sidecar = f'{file_name}.ok'
+    if os.path.exists(sidecar):
+        with open(sidecar, 'r') as f:
+            if f.read() == _verified_key(file_name, sha256):
+                return True
+    if _file_sha256(file_name) == sha256:
+        _mark_verified(file_name, sha256)
+        return True
+    return False
+
+
+def _zip_member_dest(target_dir: str, item: zipfile.ZipInfo) -> str:
+    # destination path of a zip member; rejects members which would be written outside of target_dir (e.g., absolute
+    # paths or paths containing '..' components)
+    target_dir = os.path.abspath(target_dir)
+    arcname = os.path.splitdrive(item.filename.replace('/', os.path.sep))[1].lstrip(os.path.sep)
+    dest = os.path.normpath(os.path.join(target_dir, arcname))
+    if os.path.commonpath([target_dir, dest]) != target_dir:
+        raise ValueError(f'Refusing to extract zip member {item.filename!r} outside of {target_dir}.')
+    return dest
+
+
+def _download(url: str, file_name: str, context: ssl.SSLContext) -> str:
+    # stream download to file (instead of reading the whole response into memory) and compute its hash on the fly
+    h = hashlib.sha256()
+    received = 0
+    with urllib.request.urlopen(url, context=context) as u, open(file_name, 'wb') as f:
+        expected = int(u.headers.get('Content-Length', -1))
+        # print a dot per percent of bytes received (if the size is known); the next threshold is advanced by addition
+        # instead of computing a modulo for every chunk
+        step = max(expected // 100, 0)
+        next_mark = step
+        while chunk := u.read(1 << 20):
+            h.update(chunk)
+            f.write(chunk)
+            received += len(chunk)
+            if step and received >= next_mark:
+                sys.stdout.write('.')
+                sys.stdout.flush()
+                next_mark += step
+    if 0 <= expected != received:
+        # truncated download; return an empty digest such that the caller treats the file as invalid
+        print(f' [truncated download: got {received} of {expected} bytes]', end='')
+        return ''
+    return h.hexdigest()
+
+
 class CustomInstallCommand(bdist_wheel):
 
     script_path = os.path.dirname(os.path.realpath(__file__))
@@ -70,10 +145,7 @@ class CustomInstallCommand(bdist_wheel):
 
     def _check_dload_files(self) -> bool:
         if os.path.exists(self._gdb_dload_file):
-            f = open(self._gdb_dload_file, "rb")
-            data = f.read()
-            file_hash = hashlib.sha256(data).hexdigest()
-            if self._gdb_dload_file_sha256 == file_hash:
+            if _is_verified(self._gdb_dload_file, self._gdb_dload_file_sha256):
                 print(f'{self._gdb_dload_file} exists and has valid checksum')
                 self._gdb_dload_file_valid = True
             else:
@@ -82,12 +154,6 @@ class CustomInstallCommand(bdist_wheel):
 
         return self._gdb_dload_file_valid
 
-    def _print_progress(self, count, block_size, total_size):
-        one = total_size / block_size // 100
-        if count % one == 0:
-            sys.stdout.write('.')
-            sys.stdout.flush()
-
     def _unpack_gcc(self):
         gdb_files = ('arm-none-eabi-gdb',
                      'arm-none-eabi-gdb-py3',
@@ -115,21 +181,46 @@ class CustomInstallCommand(bdist_wheel):
                      'distro-info/CHANGELOG.md',
                      'DLLs',  # used by embedded Python interpreter
                      'README.md')
+        # single matcher for all file name patterns (instead of one substring check per pattern and file)
+        gdb_files_re = re.compile('|'.join(map(re.escape, gdb_files)))
 
         first_dir: str = ''
         gdb_folder_tmp = f'{self._gdb_folder}_tmp'
 
         with ZipFile(self._gdb_dload_file, 'r') as zipObj:
-            file_names = zipObj.namelist()
-            first_dir = file_names[0].split('/')[0]
+            items = zipObj.infolist()
+            first_dir = items[0].filename.split('/')[0]
             print(f'first_dir {first_dir}')
-            for file_name in file_names:
-                if ('python' in file_name) and ('/test/' not in file_name):
-                    zipObj.extract(file_name, gdb_folder_tmp)
-                else:
-                    for gdb_file in gdb_files:
-                        if gdb_file in file_name:
-                            zipObj.extract(file_name, gdb_folder_tmp)
+            # note: members are kept as ZipInfo objects (instead of names) which avoids a name lookup per member
+            extract_items = [item for item in items
+                             if (('python' in item.filename) and ('/test/' not in item.filename))
+                             or gdb_files_re.search(item.filename)]
+
+        # sanitize destination paths (once per member) and create all folders upfront (and only once)
+        extract_items = [(item, _zip_member_dest(gdb_folder_tmp, item)) for item in extract_items]
+        for folder in {os.path.dirname(dest) for _, dest in extract_items}:
+            os.makedirs(folder, exist_ok=True)
+
+        # extract files in parallel; each worker uses its own ZipFile instance since ZipFile serializes member access
+        # note: members are copied directly instead of using ZipFile.extract which (re-)checks and creates the target
+        #       folders for each member
+        def extract(items: List[Tuple[zipfile.ZipInfo, str]]) -> None:
+            with ZipFile(self._gdb_dload_file, 'r') as zf:
+                for item, dest in items:
+                    if item.is_dir():
+                        continue
+                    with open(dest, 'wb') as dst:
+                        if item.file_size > 0:
+                            with zf.open(item) as src:
+                                shutil.copyfileobj(src, dst, min(item.file_size, 1 << 20))
+                    # restore permission bits (e.g., exec bits) if the archive provides them (Unix-created members)
+                    mode = (item.external_attr >> 16) & 0o777
+                    if mode:
+                        os.chmod(dest, mode)
+
+        num_workers: int = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(extract, [extract_items[i::num_workers] for i in range(num_workers)]))
 
         shutil.move(os.path.join(gdb_folder_tmp, first_dir), self._gdb_folder)
         shutil.rmtree(gdb_folder_tmp)
@@ -160,14 +251,16 @@ class CustomInstallCommand(bdist_wheel):
         sys.stdout.flush()
 
         if not self._gdb_dload_file_valid:
-            with urllib.request.urlopen(self._gdb_url, context=ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)) as u, open (self._gdb_dload_file, 'wb') as f:
-                f.write(u.read())
-
+            file_hash = _download(self._gdb_url, self._gdb_dload_file, ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT))
+            self._gdb_dload_file_valid = self._gdb_dload_file_sha256 == file_hash
+            if self._gdb_dload_file_valid:
+                _mark_verified(self._gdb_dload_file, self._gdb_dload_file_sha256)
 
         print(' [done]')
 
-        if not self._check_dload_files():
+        if not self._gdb_dload_file_valid:
             print("Downloaded files could not be verified (checksums don't match)")
+            os.remove(self._gdb_dload_file)
             sys.exit(-1)
 
         # dependency unpacking
@@ -192,15 +285,10 @@ class CustomInstallCommand(bdist_wheel):
 
     def _get_package_data_files(self) -> List:
         ret = []
+        tr = str.maketrans('\\', '/')  # normalize path separators in a single pass per string
         for root, dirs, files in os.walk(CustomInstallCommand.data_folder_relative):
-            src_files = []
-            root = root.replace('\\', '/')
-            root = root.replace('\\\\', '/')
-            for f in files:
-                f = f.replace('\\', '/')
-                f = f.replace('\\\\', '/')
-                src_files.append(root + '/' + f)
-            ret.append((root, src_files))
+            root = root.translate(tr)
+            ret.append((root, [root + '/' + f.translate(tr) for f in files]))
         return ret
 
 
@@ -251,18 +339,23 @@ class CustomInstallCommandLinuxAmd64(CustomInstallCommand):
                      'distro-info/licenses',
                      'distro-info/CHANGELOG.md',
                      'README.md')
+        # single matcher for all file name patterns (instead of one substring check per pattern and file)
+        gdb_files_re = re.compile('|'.join(map(re.escape, gdb_files)))
 
-        tar = tarfile.open(self._gdb_dload_file, 'r:gz')
-        first_dir: str = tar.getmembers()[0].name.split('/')[0]
+        first_dir: str | None = None
         gdb_folder_tmp = f'{self._gdb_folder}_tmp'
 
-        for file_name in tar:
-            if ('python' in file_name.name) and ('/test/' not in file_name.name):
-                tar.extract(file_name, gdb_folder_tmp)
-            else:
-                for gdb_file in gdb_files:
-                    if gdb_file in file_name.name:
-                        tar.extract(file_name, gdb_folder_tmp)
+        # note: members are processed in a single forward pass over the archive; first_dir is taken from the first
+        #       member (instead of calling getmembers() which decompresses the whole archive upfront).
+        #       Random-access mode ('r:gz') is kept (instead of streaming mode 'r|gz') since hard links might refer to
+        #       members which have not been extracted and hence need to be read again from the archive.
+        with tarfile.open(self._gdb_dload_file, 'r:gz') as tar:
+            for file_name in tar:
+                if first_dir is None:
+                    first_dir = file_name.name.split('/')[0]
+                if (('python' in file_name.name) and ('/test/' not in file_name.name)) \
+                        or gdb_files_re.search(file_name.name):
+                    tar.extract(file_name, gdb_folder_tmp)
 
         shutil.move(os.path.join(gdb_folder_tmp, first_dir), self._gdb_folder)
         shutil.rmtree(gdb_folder_tmp)
@@ -313,14 +406,16 @@ class CustomInstallCommandPEMicroLinuxAmd64(CustomInstallCommand):
         sys.stdout.flush()
 
         if not self._pe_dload_file_valid:
-            with urllib.request.urlopen(self._pe_url, context=ssl.SSLContext()) as u, open (self._pe_dload_file, 'wb') as f:
-                f.write(u.read())
-
+            file_hash = _download(self._pe_url, self._pe_dload_file, ssl.SSLContext())
+            self._pe_dload_file_valid = self._pe_dload_file_sha256 == file_hash
+            if self._pe_dload_file_valid:
+                _mark_verified(self._pe_dload_file, self._pe_dload_file_sha256)
 
         print(' [done]')
 
-        if not self._check_dload_files():
+        if not self._pe_dload_file_valid:
             print("Downloaded files could not be verified (checksums don't match)")
+            os.remove(self._pe_dload_file)
             sys.exit(-1)
 
         # dependency unpacking
@@ -346,10 +441,7 @@ class CustomInstallCommandPEMicroLinuxAmd64(CustomInstallCommand):
 
     def _check_dload_files(self) -> bool:
         if os.path.exists(self._pe_dload_file):
-            f = open(self._pe_dload_file, "rb")
-            data = f.read()
-            file_hash = hashlib.sha256(data).hexdigest()
-            if self._pe_dload_file_sha256 == file_hash:
+            if _is_verified(self._pe_dload_file, self._pe_dload_file_sha256):
                 print(f'{self._pe_dload_file} exists and has valid checksum')
                 self._pe_dload_file_valid = True
             else:
@@ -372,13 +464,12 @@ class CustomInstallCommandPEMicroLinuxAmd64(CustomInstallCommand):
                     'target_v8a_no_vfp.xml',
                     'target_v8m_vfp_no_se.xml',
                     'target_v8m_vfp_se.xml')
+        pe_files_re = re.compile('|'.join(map(re.escape, pe_files)))
 
         with ZipFile(self._pe_dload_file, 'r') as zipObj:
-            file_names = zipObj.namelist()
-            for file_name in file_names:
-                for pe_file in pe_files:
-                    if pe_file in file_name:
-                        zipObj.extract(file_name, self._pe_folder)
+            for item in zipObj.infolist():
+                if pe_files_re.search(item.filename):
+                    zipObj.extract(item, self._pe_folder)
 
         with open(os.path.join(self._pe_folder, 'version.txt'), 'w+') as f:
             f.write(f'GDB and support tools extracted from GNU Arm Embedded Toolchain.\n')
@@ -395,28 +486,30 @@ class CustomInstallCommandPEMicroLinuxAmd64(CustomInstallCommand):
 
 
 def _set_execperms_in_whl(dir: str, pattern: str):
+    # Sets files matching pattern executable by patching the external attributes of their entries in the central
+    # directory of the whl (zip) file in place. Compressed file contents are left untouched.
+    exec_perms: int = (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH) << 16
     for name in glob.glob(os.path.join(dir, '*.whl')):
-        name_tmp: str = name.replace('.whl', '_NEW.whl')
-
-        # create temp file
-        with open(name_tmp, 'w') as f:
-            f.close()
-
-        # open input and output whl (zip) files; set files matching pattern executable in output archive.
-        zf_in = zipfile.ZipFile(name, 'r')
-        zf_out = zipfile.ZipFile(name_tmp, 'w')
-        zf_out.comment = zf_in.comment
-        for item in zf_in.filelist:
-            if pattern in item.filename:
-                perm = item.external_attr >> 16 | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
-                item.external_attr = perm << 16
-            zf_out.writestr(item, zf_in.read(item.filename))
-        zf_out.close()
-        zf_in.close()
-
-        # remove the original whl and replace it with the new one
-        os.remove(name)
-        shutil.move(name_tmp, name)
+        with open(name, 'r+b') as f:
+            with zipfile.ZipFile(f, 'r') as zf:
+                items = zf.infolist()  # note: same order as entries in central directory
+                start_dir: int = zf.start_dir
+
+            f.seek(start_dir)
+            cd = bytearray(f.read())
+            offs: int = 0
+            for item in items:
+                # central directory file header: signature at 0, name/extra/comment lengths at 28, external attributes
+                # at 38, fixed part is 46 bytes long
+                sig, name_len, extra_len, comment_len = struct.unpack_from('<4s24xHHH', cd, offs)
+                if sig != b'PK\x01\x02':
+                    raise ValueError(f'Unexpected central directory layout in {name}.')
+                if pattern in item.filename:
+                    struct.pack_into('<L', cd, offs + 38, item.external_attr | exec_perms)
+                offs += 46 + name_len + extra_len + comment_len
+
+            f.seek(start_dir)
+            f.write(cd)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -548,10 +641,10 @@ if '--dott-runtime-win-amd64' in sys.argv:
 elif '--dott-runtime-linux-amd64' in sys.argv:
     sys.argv.remove('--dott-runtime-linux-amd64')
     setup_dott_runtime_linux_amd64()
-    _set_execperms_in_whl(os.path.join(os.path.dirname(__file__), 'dist'), '/bin/')
+    _set_execperms_in_whl(os.path.join(CustomInstallCommand.script_path, 'dist'), '/bin/')
 elif '--dott-runtime-pemicro-s32k' in sys.argv:
     sys.argv.remove('--dott-runtime-pemicro-s32k')
     setup_dott_runtime_pemicro_s32k()
-    _set_execperms_in_whl(os.path.join(os.path.dirname(__file__), 'dist'), '/lin/')
+    _set_execperms_in_whl(os.path.join(CustomInstallCommand.script_path, 'dist'), '/lin/')
 else:
     setup_dott()
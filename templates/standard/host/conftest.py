@@ -19,30 +19,32 @@
 import os
 import sys
 import socket
-sys.path.append(f'{os.path.dirname(os.path.realpath(__file__))}/../../../src/host')
+
+# folder which contains this conftest file (resolved once)
+_HERE = os.path.dirname(os.path.realpath(__file__))
+
+sys.path.append(f'{_HERE}/../../../src/host')
 # note: the dottmi imports have to be done after the sys path was adjusted (see line above)
 from dottmi.fixtures import *  # note: it is important to fully import dottmi.fixtures
 from dottmi.dott import DottConf
 
 # set working directory to the folder which contains this conftest file
-os.chdir(os.path.dirname(os.path.realpath(__file__)))
+os.chdir(_HERE)
 
 
-def set_config_options():
-    # machine-specific settings (selected based on hostname)
-    hostname = socket.gethostname()
+# machine-specific settings (selected based on lower-case hostname)
+_HOST_CONFIG = {
+    # running on Ubuntu Linux 22.04 Jenkins slave
+    'dott': {'jlink_serial': '51014146'},
+    # development machine
+    'thunder': {},
+    # 'your_host_name': {'gdb_server_addr': 'WWW.XXX.YYY.ZZZ',  # only needed for a remote JLINK connected to RaspberryPI
+    #                    'pigpio_addr': 'AAA.BBB.CCC.DDD'},  # remote PiGPIO daemon on RaspberryPI
+}
 
-    if hostname.lower() == 'dott':
-        # running on Ubuntu Linux 22.04 Jenkins slave
-        DottConf.set('jlink_serial', '51014146')
 
-    elif hostname.lower() == 'thunder':
-        # development machine
-        pass
-
-#    elif hostname == 'YOUR_HOST_NAME':
-#        DottConf.set('gdb_server_addr', 'WWW.XXX.YYY.ZZZ')  # only needed for a remote JLINK connected to RaspberryPI
-#        DottConf.set('pigpio_addr', 'AAA.BBB.CCC.DDD')  # remote PiGPIO daemon on RaspberryPI
+def set_config_options():
+    DottConf.update(_HOST_CONFIG.get(socket.gethostname().lower(), {}))
 
 # set host-specific parameters
 set_config_options()
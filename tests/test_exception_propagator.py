@@ -0,0 +1,83 @@
+# vim: set tabstop=4 expandtab :
+###############################################################################
+#   Copyright (c) 2022-2024 Thomas Winkler <thomas.winkler@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+###############################################################################
+
+# Host-only tests (no target or debugger required) for the propagation of exceptions raised in callback threads
+# (e.g., halt point callbacks) to the test function via the pytest_runtest_call hook in dottmi.fixtures.
+
+pytest_plugins = 'pytester'
+
+_CONFTEST = '''
+from dottmi.fixtures import pytest_runtest_call
+'''
+
+_TESTS = '''
+import threading
+from dottmi.utils import ExceptionPropagator
+
+
+def _failing_callback():
+    try:
+        assert 1 == 2, 'callback failed'
+    except Exception as exc:
+        ExceptionPropagator.propagate_exception(exc)
+
+
+def _run_in_thread(func):
+    t = threading.Thread(target=func)
+    t.start()
+    t.join()
+
+
+def test_callback_fails():
+    _run_in_thread(_failing_callback)
+
+
+def test_callback_and_test_fail():
+    _run_in_thread(_failing_callback)
+    assert False, 'test failed'
+
+
+def test_pass():
+    pass
+'''
+
+
+class TestExceptionPropagator(object):
+
+    def _run(self, pytester) -> dict:
+        pytester.makeconftest(_CONFTEST)
+        pytester.makepyfile(_TESTS)
+        reprec = pytester.inline_run('-W', 'error::pluggy.PluggyTeardownRaisedWarning')
+        return {rep.head_line: rep for rep in reprec.getreports('pytest_runtest_logreport') if not rep.passed}
+
+    def test_callback_failure_in_call_phase(self, pytester):
+        failed = self._run(pytester)
+
+        # callback failures are reported as failure of the test itself (not as error during teardown)
+        rep = failed['test_callback_fails']
+        assert rep.when == 'call'
+        assert 'callback failed' in rep.longreprtext
+        assert 'test_pass' not in failed
+
+    def test_test_failure_is_kept(self, pytester, caplog):
+        failed = self._run(pytester)
+
+        # the test's own failure is reported; the callback exception is only logged
+        rep = failed['test_callback_and_test_fail']
+        assert rep.when == 'call'
+        assert 'test failed' in rep.longreprtext
+        assert 'Exception propagated from thread while test failed' in caplog.text